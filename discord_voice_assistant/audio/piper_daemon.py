@@ -0,0 +1,73 @@
+"""Long-running Piper worker process.
+
+Loads a Piper voice once and synthesizes one utterance per stdin line so
+the ONNX model load is paid at startup rather than on every sentence.
+
+Protocol (stdin/stdout, one request at a time):
+  - request:  one JSON object per line, ``{"text": "..."}``
+  - response: 4-byte big-endian length followed by that many bytes of WAV.
+    A zero-length frame is sent once after the model loads (ready signal)
+    and in place of audio if a request fails.
+
+Run as ``python -m discord_voice_assistant.audio.piper_daemon --model <path>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import logging
+import struct
+import sys
+import wave
+
+log = logging.getLogger("piper_daemon")
+
+
+def _synthesize(voice, text: str) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        # piper >= 1.3 renamed the WAV-writing API to synthesize_wav()
+        if hasattr(voice, "synthesize_wav"):
+            voice.synthesize_wav(text, wf)
+        else:
+            voice.synthesize(text, wf)
+    return buf.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", required=True, help="Path to .onnx voice model")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+
+    # stdout carries the binary protocol; keep stray prints off it
+    out = sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    from piper import PiperVoice
+
+    voice = PiperVoice.load(args.model)
+
+    def send(payload: bytes) -> None:
+        out.write(struct.pack(">I", len(payload)))
+        out.write(payload)
+        out.flush()
+
+    send(b"")  # ready
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            text = json.loads(line)["text"]
+            send(_synthesize(voice, text))
+        except Exception:
+            log.exception("Synthesis failed")
+            send(b"")
+
+
+if __name__ == "__main__":
+    main()
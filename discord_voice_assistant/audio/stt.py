@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,14 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Whisper inference threads per SpeechToText instance.  Kept small and
+# separate from the default executor so concurrent transcriptions can't
+# crowd out TTS model resolution, voicemail encoding, etc.
+_STT_MAX_WORKERS = 2
+
+# int16 PCM -> float32 [-1, 1)
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
 
 class SpeechToText:
     """Transcribes audio using Faster Whisper (CTranslate2-based Whisper)."""
@@ -23,6 +32,9 @@ class SpeechToText:
         self.config = config
         self._model = None
         self._model_lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=_STT_MAX_WORKERS, thread_name_prefix="stt"
+        )
 
     def _get_model(self):
         """Lazy-load the Whisper model."""
@@ -92,7 +104,11 @@ class SpeechToText:
     async def warm_up(self) -> None:
         """Pre-load the Whisper model so the first transcription isn't delayed."""
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._get_model)
+        await loop.run_in_executor(self._executor, self._get_model)
+
+    def close(self) -> None:
+        """Release the inference thread pool."""
+        self._executor.shutdown(wait=False)
 
     async def transcribe(self, audio_data: bytes, sample_rate: int = 16000) -> str:
         """Transcribe audio bytes (16-bit PCM, mono) to text.
@@ -104,8 +120,11 @@ class SpeechToText:
         Returns:
             Transcribed text, or empty string if nothing detected.
         """
-        # Convert bytes to float32 numpy array (Whisper expects float32 in [-1, 1])
-        audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+        # Convert bytes to float32 numpy array (Whisper expects float32 in [-1, 1]).
+        # Scale straight from the int16 view in one pass — no intermediate
+        # float copy from astype() before the division.
+        pcm = np.frombuffer(audio_data, dtype=np.int16)
+        audio_np = np.multiply(pcm, _PCM16_SCALE, dtype=np.float32)
 
         if len(audio_np) == 0:
             log.debug("STT received empty audio, returning empty string")
@@ -119,7 +138,9 @@ class SpeechToText:
 
         # Run transcription in a thread to avoid blocking the event loop
         loop = asyncio.get_running_loop()
-        text = await loop.run_in_executor(None, self._transcribe_sync, audio_np)
+        text = await loop.run_in_executor(
+            self._executor, self._transcribe_sync, audio_np
+        )
         return text
 
     def _transcribe_sync(self, audio: np.ndarray) -> str:
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import io
+import json
 import logging
 import os
 import re
+import shutil
 import struct
+import sys
 import time
 import wave
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -27,9 +31,12 @@ _PIPER_MODEL_DIR = Path(
     )
 )
 
-# HuggingFace base URL for downloading Piper voice models
+# HuggingFace repo/revision for downloading Piper voice models
+_PIPER_HF_REPO = "rhasspy/piper-voices"
+_PIPER_HF_REVISION = "v1.0.0"
+# Plain-URL fallback used when huggingface_hub is not installed
 _PIPER_HF_BASE = (
-    "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0"
+    f"https://huggingface.co/{_PIPER_HF_REPO}/resolve/{_PIPER_HF_REVISION}"
 )
 
 # Regex patterns for stripping markdown/emoji before TTS
@@ -46,33 +53,55 @@ _MARKDOWN_PATTERNS = [
     (re.compile(r"^\s*\d+\.\s+", re.MULTILINE), ""),        # numbered lists
     (re.compile(r"\[([^\]]+)\]\([^)]+\)"), r"\1"),           # links
 ]
-# Common emoji ranges
-_EMOJI_RE = re.compile(
-    "["
-    "\U0001f300-\U0001f9ff"  # misc symbols, emoticons, etc.
-    "\U00002702-\U000027b0"  # dingbats
-    "\U0000fe00-\U0000fe0f"  # variation selectors
-    "\U0000200d"             # zero-width joiner
-    "\u2600-\u26ff"          # misc symbols
-    "\u2700-\u27bf"          # dingbats
-    "\u2300-\u23ff"          # misc technical
-    "\u2b50-\u2b55"          # stars
-    "\u200d"                 # zwj
-    "\u2934-\u2935"          # arrows
-    "\u25aa-\u25fe"          # geometric shapes
-    "\u2139"                 # info
-    "\u2194-\u21aa"          # arrows
-    "\u2714\u2716\u2728"     # check, x, sparkles
-    "]+",
-    flags=re.UNICODE,
+# Common emoji ranges (inclusive codepoint bounds)
+_EMOJI_RANGES = (
+    (0x1F300, 0x1F9FF),  # misc symbols, emoticons, etc.
+    (0x2702, 0x27B0),    # dingbats
+    (0xFE00, 0xFE0F),    # variation selectors
+    (0x200D, 0x200D),    # zero-width joiner
+    (0x2600, 0x26FF),    # misc symbols
+    (0x2700, 0x27BF),    # dingbats
+    (0x2300, 0x23FF),    # misc technical
+    (0x2B50, 0x2B55),    # stars
+    (0x2934, 0x2935),    # arrows
+    (0x25AA, 0x25FE),    # geometric shapes
+    (0x2139, 0x2139),    # info
+    (0x2194, 0x21AA),    # arrows
+    (0x2714, 0x2714),    # check
+    (0x2716, 0x2716),    # x
+    (0x2728, 0x2728),    # sparkles
 )
+# str.translate deletion table — a single C-level pass with no regex engine
+_EMOJI_TABLE: dict[int, None] = dict.fromkeys(
+    cp for lo, hi in _EMOJI_RANGES for cp in range(lo, hi + 1)
+)
+
 
+# Texts longer than this are cleaned in the executor instead of inline
+_CLEAN_OFFLOAD_CHARS = 1024
+# Texts up to this length have their cleaned form cached
+_CLEAN_CACHE_MAX_CHARS = 4096
 
 # Amplitude threshold for detecting "silence" in 16-bit PCM.
 # Samples with abs(value) below this are considered silent.
 _SILENCE_THRESHOLD = 256
 
 
+_WAV_HEADER_SIZE = 44
+
+
+def _wav_header(data_len: int, sample_rate: int = 16000, channels: int = 1) -> bytes:
+    """Build a canonical 44-byte header for 16-bit PCM WAV data."""
+    block_align = channels * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_len, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, 16,
+        b"data", data_len,
+    )
+
+
 def _strip_leading_silence(wav_bytes: bytes) -> bytes:
     """Strip leading silent samples from WAV audio.
 
@@ -92,22 +121,16 @@ def _strip_leading_silence(wav_bytes: bytes) -> bytes:
             # Only handle 16-bit PCM (the only format Piper/ElevenLabs produce)
             return wav_bytes
 
+        import numpy as np
+
         frame_size = sampwidth * nchannels
-        first_audible = 0
-
-        for i in range(0, len(frames), frame_size):
-            audible = False
-            for ch in range(nchannels):
-                sample = struct.unpack_from("<h", frames, i + ch * sampwidth)[0]
-                if abs(sample) >= _SILENCE_THRESHOLD:
-                    audible = True
-                    break
-            if audible:
-                first_audible = i
-                break
-        else:
+        samples = np.frombuffer(frames, dtype="<i2", count=len(frames) // 2)
+        # Compare against both bounds rather than abs() so -32768 can't overflow
+        audible = (samples >= _SILENCE_THRESHOLD) | (samples <= -_SILENCE_THRESHOLD)
+        if not audible.any():
             # Entire clip is silence — return original unchanged
             return wav_bytes
+        first_audible = (int(audible.argmax()) // nchannels) * frame_size
 
         if first_audible == 0:
             return wav_bytes
@@ -129,10 +152,27 @@ def _strip_leading_silence(wav_bytes: bytes) -> bytes:
 
 
 def _clean_for_tts(text: str) -> str:
-    """Strip markdown formatting and emoji so TTS reads naturally."""
+    """Strip markdown formatting and emoji so TTS reads naturally.
+
+    Short texts are memoized — fillers, greetings, and error messages
+    repeat often enough that a dict lookup beats rerunning the regexes.
+    """
+    if len(text) <= _CLEAN_CACHE_MAX_CHARS:
+        return _clean_for_tts_cached(text)
+    return _clean_for_tts_uncached(text)
+
+
+@lru_cache(maxsize=256)
+def _clean_for_tts_cached(text: str) -> str:
+    return _clean_for_tts_uncached(text)
+
+
+def _clean_for_tts_uncached(text: str) -> str:
     for pattern, replacement in _MARKDOWN_PATTERNS:
         text = pattern.sub(replacement, text)
-    text = _EMOJI_RE.sub("", text)
+    # Emoji are all non-ASCII, so the common ASCII-only reply skips this
+    if not text.isascii():
+        text = text.translate(_EMOJI_TABLE)
     # Collapse whitespace
     text = re.sub(r"\s+", " ", text).strip()
     # Clean up spoken transitions at boundaries
@@ -143,6 +183,53 @@ def _clean_for_tts(text: str) -> str:
     return text
 
 
+def _download_via_hf_hub(
+    repo_path: str, model: str, dl_onnx: Path, dl_json: Path
+) -> bool:
+    """Fetch a Piper model with huggingface_hub into the Piper model directory.
+
+    Files are downloaded as real files into a per-model staging directory
+    (not symlinks into the HF cache, which is not on the persisted models
+    volume), moved into place beside the other voices, and the staging
+    directory (with huggingface_hub's metadata) is removed.
+
+    Returns False if huggingface_hub is not installed or the download
+    fails, so the caller can fall back to a plain HTTP download.
+    """
+    # hf_transfer is read at import time and errors if enabled but missing
+    import importlib.util
+    if importlib.util.find_spec("hf_transfer") is not None:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    try:
+        from huggingface_hub import hf_hub_download
+    except ImportError:
+        log.debug("huggingface_hub not installed, using plain HTTP download")
+        return False
+
+    staging_dir = dl_onnx.parent / f".hf-{model}"
+    try:
+        for filename, dest in (
+            (f"{repo_path}/{model}.onnx", dl_onnx),
+            (f"{repo_path}/{model}.onnx.json", dl_json),
+        ):
+            downloaded = hf_hub_download(
+                repo_id=_PIPER_HF_REPO,
+                filename=filename,
+                revision=_PIPER_HF_REVISION,
+                local_dir=staging_dir,
+            )
+            os.replace(downloaded, dest)
+    except Exception as e:
+        # HTTP errors, offline mode (LocalEntryNotFoundError), disk errors
+        log.warning(
+            "huggingface_hub download of '%s' failed, using plain HTTP: %s", model, e,
+        )
+        return False
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    return True
+
+
 def _resolve_piper_model(model: str) -> str:
     """Resolve a Piper model name or path to an absolute .onnx path.
 
@@ -185,10 +272,6 @@ def _resolve_piper_model(model: str) -> str:
         voice = voice_quality[:last_dash]   # e.g. "lessac" or "hfc_female"
         quality = voice_quality[last_dash + 1:]  # e.g. "medium" or "high"
 
-        base_url = f"{_PIPER_HF_BASE}/{lang}/{locale}/{voice}/{quality}"
-        onnx_url = f"{base_url}/{model}.onnx"
-        json_url = f"{base_url}/{model}.onnx.json"
-
         log.info("Downloading Piper model '%s' from HuggingFace...", model)
 
         # Try the configured model dir first; fall back to a writable
@@ -213,9 +296,12 @@ def _resolve_piper_model(model: str) -> str:
         dl_onnx = download_dir / f"{model}.onnx"
         dl_json = download_dir / f"{model}.onnx.json"
 
-        import urllib.request
-        urllib.request.urlretrieve(onnx_url, str(dl_onnx))
-        urllib.request.urlretrieve(json_url, str(dl_json))
+        repo_path = f"{lang}/{locale}/{voice}/{quality}"
+        if not _download_via_hf_hub(repo_path, model, dl_onnx, dl_json):
+            import urllib.request
+            base_url = f"{_PIPER_HF_BASE}/{repo_path}"
+            urllib.request.urlretrieve(f"{base_url}/{model}.onnx", str(dl_onnx))
+            urllib.request.urlretrieve(f"{base_url}/{model}.onnx.json", str(dl_json))
 
         log.info("Piper model '%s' downloaded to %s", model, dl_onnx)
         return str(dl_onnx)
@@ -231,6 +317,199 @@ def _resolve_piper_model(model: str) -> str:
         return str(onnx_path)
 
 
+async def _kill_process(proc: asyncio.subprocess.Process | None) -> None:
+    """Kill and reap a subprocess that overran its timeout or was abandoned."""
+    if proc is None or proc.returncode is not None:
+        return
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass
+    await proc.wait()
+
+
+# Maximum number of persistent Piper workers (one per loaded voice model)
+_MAX_PIPER_DAEMONS = 2
+# Backoff before retrying a model whose worker failed to start (seconds);
+# doubles per consecutive failure up to the max
+_PIPER_RETRY_DELAY = 30.0
+_PIPER_RETRY_MAX_DELAY = 600.0
+
+
+class _PiperDaemon:
+    """A persistent Piper worker process serving one voice model.
+
+    See :mod:`discord_voice_assistant.audio.piper_daemon` for the wire
+    protocol.  Requests are serialized with a lock since the worker
+    handles one utterance at a time.
+    """
+
+    def __init__(self, model_path: str) -> None:
+        self.model_path = model_path
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_alive(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    async def _read_frame(self, timeout: float) -> bytes:
+        header = await asyncio.wait_for(
+            self._proc.stdout.readexactly(4), timeout=timeout
+        )
+        (length,) = struct.unpack(">I", header)
+        if not length:
+            return b""
+        return await asyncio.wait_for(
+            self._proc.stdout.readexactly(length), timeout=timeout
+        )
+
+    async def start(self, timeout: float = 60) -> bool:
+        """Spawn the worker and wait for the model to load."""
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "discord_voice_assistant.audio.piper_daemon",
+                "--model", self.model_path,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                # Inherited so worker tracebacks (PiperVoice load/synthesis
+                # errors) show up in the bot's own log output
+                stderr=None,
+            )
+            t0 = time.monotonic()
+            await self._read_frame(timeout)
+            log.info(
+                "Persistent Piper worker ready in %.3fs (model=%s)",
+                time.monotonic() - t0, self.model_path,
+            )
+            return True
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            log.warning(
+                "Persistent Piper worker failed to start for %s, "
+                "using per-utterance CLI",
+                self.model_path,
+            )
+            await self.close()
+            return False
+        except BaseException:
+            await self._abort()
+            raise
+
+    async def synthesize(self, text: str, timeout: float = 60) -> bytes | None:
+        """Synthesize one utterance. Returns None if the worker is unusable."""
+        async with self._lock:
+            if not self.is_alive:
+                return None
+            try:
+                self._proc.stdin.write(
+                    json.dumps({"text": text}).encode("utf-8") + b"\n"
+                )
+                await self._proc.stdin.drain()
+                return await self._read_frame(timeout) or None
+            except (
+                OSError, asyncio.IncompleteReadError, asyncio.TimeoutError,
+            ):
+                log.warning("Persistent Piper worker died", exc_info=True)
+                await self.close()
+                return None
+            except BaseException:
+                # Cancelled (e.g. barge-in) with a reply still in flight: the
+                # worker's next frame would answer the next caller, so it
+                # can't be reused.  Kill it before the lock is released.
+                await self._abort()
+                raise
+
+    async def close_when_idle(self) -> None:
+        """Stop the worker once any in-flight request has finished."""
+        async with self._lock:
+            await self.close()
+
+    async def _abort(self) -> None:
+        """Kill the worker immediately (the kill is sent before any await)."""
+        proc, self._proc = self._proc, None
+        await _kill_process(proc)
+
+    async def close(self) -> None:
+        """Stop the worker process."""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        if proc.stdin:
+            proc.stdin.close()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=2)
+        except asyncio.TimeoutError:
+            await _kill_process(proc)
+
+
+class PiperWorkerPool:
+    """Persistent Piper workers shared by every TextToSpeech instance.
+
+    Holds at most ``_MAX_PIPER_DAEMONS`` workers keyed by model path,
+    evicting the least recently used.  A model whose worker fails to start
+    is retried after a backoff; until then callers use the CLI.
+    """
+
+    def __init__(self) -> None:
+        # Workers keyed by model path (insertion = LRU order)
+        self._daemons: dict[str, _PiperDaemon] = {}
+        # model path -> (current backoff delay, monotonic retry time) for
+        # models whose worker failed to start
+        self._failures: dict[str, tuple[float, float]] = {}
+        self._lock = asyncio.Lock()
+
+    def _retry_pending(self, model_path: str) -> bool:
+        failure = self._failures.get(model_path)
+        return failure is not None and time.monotonic() < failure[1]
+
+    async def get(self, model_path: str) -> _PiperDaemon | None:
+        """Return a running worker for ``model_path``, starting one if needed."""
+        daemon = self._daemons.get(model_path)
+        if daemon is not None and daemon.is_alive:
+            # Move to the end (most recently used)
+            self._daemons[model_path] = self._daemons.pop(model_path)
+            return daemon
+        if self._retry_pending(model_path):
+            return None
+
+        evicted: _PiperDaemon | None = None
+        # Serialize startup so concurrent first calls share one worker
+        async with self._lock:
+            daemon = self._daemons.get(model_path)
+            if daemon is not None and daemon.is_alive:
+                return daemon
+            if self._retry_pending(model_path):
+                return None
+            self._daemons.pop(model_path, None)
+            daemon = _PiperDaemon(model_path)
+            if not await daemon.start():
+                previous = self._failures.get(model_path)
+                delay = (
+                    min(previous[0] * 2, _PIPER_RETRY_MAX_DELAY)
+                    if previous else _PIPER_RETRY_DELAY
+                )
+                self._failures[model_path] = (delay, time.monotonic() + delay)
+                log.info(
+                    "Retrying the Piper worker for %s in %.0fs", model_path, delay
+                )
+                return None
+            self._failures.pop(model_path, None)
+            if len(self._daemons) >= _MAX_PIPER_DAEMONS:
+                evicted = self._daemons.pop(next(iter(self._daemons)))
+            self._daemons[model_path] = daemon
+        if evicted is not None:
+            await evicted.close_when_idle()
+        return daemon
+
+    async def close(self) -> None:
+        """Shut down all workers."""
+        daemons = list(self._daemons.values())
+        self._daemons.clear()
+        for daemon in daemons:
+            await daemon.close()
+
+
+@lru_cache(maxsize=8)
 def generate_thinking_sound(
     tone1_hz: float = 130,
     tone2_hz: float = 130,
@@ -259,8 +538,11 @@ def generate_thinking_sound(
         duration: Approximate length of the WAV clip in seconds (snapped
             to the nearest whole pulse cycle for seamless looping)
         sample_rate: Audio sample rate
+
+    Results are memoized per parameter set, so every voice session after
+    the first reuses the same clip instead of regenerating it.
     """
-    import math
+    import numpy as np
 
     # Snap duration to a whole number of pulse cycles so the loop is
     # seamless.  E.g. pulse_hz=0.3 → period=3.333s, duration=2.5 snaps
@@ -271,30 +553,22 @@ def generate_thinking_sound(
         duration = n_cycles * pulse_period
 
     num_samples = int(sample_rate * duration)
-    samples = []
-
     tone2_mix = 1.0 - tone_mix
+    t = np.arange(num_samples, dtype=np.float64) / sample_rate
 
-    for i in range(num_samples):
-        t = i / sample_rate
-
-        # Pulse envelope: ``(1 - cos)`` shape so amplitude is zero at
-        # t=0 and t=duration (the loop boundary).  Each pulse fades in
-        # smoothly, peaks at the midpoint, and fades back to silence.
-        pulse = 0.5 * (1.0 - math.cos(2 * math.pi * pulse_hz * t))
-
-        # Two sine tones for a warm timbre
-        t1 = math.sin(2 * math.pi * tone1_hz * t)
-        t2 = math.sin(2 * math.pi * tone2_hz * t)
+    # Pulse envelope: ``(1 - cos)`` shape so amplitude is zero at
+    # t=0 and t=duration (the loop boundary).  Each pulse fades in
+    # smoothly, peaks at the midpoint, and fades back to silence.
+    pulse = 0.5 * (1.0 - np.cos(2 * np.pi * pulse_hz * t))
 
-        # Mix tones and apply pulse envelope
-        sample = (tone_mix * t1 + tone2_mix * t2) * pulse * volume
+    # Two sine tones for a warm timbre
+    t1 = np.sin(2 * np.pi * tone1_hz * t)
+    t2 = np.sin(2 * np.pi * tone2_hz * t)
 
-        # Convert to 16-bit PCM
-        sample_int = max(-32768, min(32767, int(sample * 32767)))
-        samples.append(struct.pack("<h", sample_int))
+    # Mix tones, apply pulse envelope, and convert to 16-bit PCM
+    samples = (tone_mix * t1 + tone2_mix * t2) * pulse * volume
+    pcm_data = np.clip(samples * 32767, -32768, 32767).astype("<i2").tobytes()
 
-    pcm_data = b"".join(samples)
     wav_buffer = io.BytesIO()
     with wave.open(wav_buffer, "wb") as wf:
         wf.setnchannels(1)
@@ -310,13 +584,20 @@ class TextToSpeech:
     Supports per-user voice overrides: callers can pass ``provider``,
     ``elevenlabs_voice_id``, or ``local_model`` to ``synthesize()`` to
     override the config defaults on a per-request basis.
+
+    Pass a shared ``piper_pool`` so all instances reuse the same Piper
+    workers; without one the instance starts (and closes) its own.
     """
 
-    def __init__(self, config: TTSConfig) -> None:
+    def __init__(
+        self, config: TTSConfig, piper_pool: PiperWorkerPool | None = None
+    ) -> None:
         self.config = config
         self._elevenlabs_client = None
         # Cache of resolved Piper model paths: model_name -> absolute path
         self._piper_model_cache: dict[str, str] = {}
+        self._piper_pool = piper_pool or PiperWorkerPool()
+        self._owns_piper_pool = piper_pool is None
         self._strip_silence = config.strip_leading_silence
 
     async def warm_up(self) -> None:
@@ -324,12 +605,21 @@ class TextToSpeech:
         if self.config.provider == "elevenlabs":
             await self._ensure_elevenlabs_client()
         else:
-            loop = asyncio.get_running_loop()
-            resolved = await loop.run_in_executor(
-                None, _resolve_piper_model, self.config.local_model
-            )
-            self._piper_model_cache[self.config.local_model] = resolved
+            resolved = await self._resolve_model_path(self.config.local_model)
             log.debug("Piper model pre-resolved: %s", resolved)
+            if os.path.isfile(resolved):
+                await self._get_piper_daemon(resolved)
+
+    async def close(self) -> None:
+        """Shut down this instance's Piper workers (a shared pool is left running)."""
+        if self._owns_piper_pool:
+            await self._piper_pool.close()
+
+    async def _get_piper_daemon(self, model_path: str) -> _PiperDaemon | None:
+        """Return a running Piper worker for ``model_path``, or None to use the CLI."""
+        if not self.config.persistent_piper:
+            return None
+        return await self._piper_pool.get(model_path)
 
     async def _ensure_elevenlabs_client(self) -> bool:
         """Lazily initialize the ElevenLabs client. Returns True on success."""
@@ -372,7 +662,13 @@ class TextToSpeech:
 
         # Strip markdown and emoji so TTS reads naturally
         original_len = len(text)
-        text = _clean_for_tts(text)
+        if original_len > _CLEAN_OFFLOAD_CHARS:
+            # Long replies take long enough to clean that running the regex
+            # chain inline would stall the event loop
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(None, _clean_for_tts, text)
+        else:
+            text = _clean_for_tts(text)
         if not text:
             log.debug("TTS text empty after cleaning (was %d chars)", original_len)
             return None
@@ -432,111 +728,146 @@ class TextToSpeech:
             output_format="pcm_16000",
         )
 
-        # Collect all chunks
-        pcm_data = b""
+        # Write the WAV header up front and append chunks as they arrive,
+        # then patch in the final sizes — no second copy to wrap the PCM.
+        wav = bytearray(_wav_header(0, sample_rate=16000, channels=1))
         async for chunk in audio_stream:
-            pcm_data += chunk
+            wav += chunk
 
-        log.debug("ElevenLabs returned %d bytes of PCM", len(pcm_data))
-        # Wrap raw PCM in WAV container for FFmpeg
-        return self._pcm_to_wav(pcm_data, sample_rate=16000, channels=1)
+        pcm_len = len(wav) - _WAV_HEADER_SIZE
+        log.debug("ElevenLabs returned %d bytes of PCM", pcm_len)
+        wav[:_WAV_HEADER_SIZE] = _wav_header(pcm_len, sample_rate=16000, channels=1)
+        return bytes(wav)
 
     async def _synthesize_local(
         self, text: str, *, model: str | None = None
     ) -> bytes | None:
         """Synthesize using local Piper TTS."""
         effective_model = model or self.config.local_model
+        return await self._synthesize_piper_async(text, effective_model)
+
+    async def _resolve_model_path(self, model_name: str) -> str:
+        """Resolve a Piper model name to a path, caching only existing files.
+
+        Resolution may download the model, so it runs in the executor.
+        """
+        if model_name in self._piper_model_cache:
+            return self._piper_model_cache[model_name]
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None, self._synthesize_piper_sync, text, effective_model
+        model_path = await loop.run_in_executor(
+            None, _resolve_piper_model, model_name
         )
+        if os.path.isfile(model_path):
+            self._piper_model_cache[model_name] = model_path
+        else:
+            log.warning(
+                "Piper model '%s' resolved to non-existent path: %s "
+                "(not caching — will retry next time)",
+                model_name,
+                model_path,
+            )
+        return model_path
 
-    def _synthesize_piper_sync(
+    async def _synthesize_piper_async(
         self, text: str, model_name: str | None = None
     ) -> bytes | None:
-        """Synchronous Piper TTS synthesis via CLI subprocess.
+        """Piper TTS synthesis via a persistent worker or the CLI.
 
-        Uses the piper CLI (installed by piper-tts) rather than the Python API,
-        which has version-specific bugs with wave header writing.
+        A long-running worker keeps the voice model loaded between
+        utterances.  If it can't be used, falls back to spawning the piper
+        CLI (installed by piper-tts) per utterance.  Subprocesses are
+        awaited directly so no executor thread is tied up while Piper runs.
         """
-        import subprocess
-
         effective_model = model_name or self.config.local_model
-        # Resolve model name to path (only cache if the file actually exists)
-        if effective_model in self._piper_model_cache:
-            model_path = self._piper_model_cache[effective_model]
-        else:
-            model_path = _resolve_piper_model(effective_model)
-            if os.path.isfile(model_path):
-                self._piper_model_cache[effective_model] = model_path
-            else:
-                log.warning(
-                    "Piper model '%s' resolved to non-existent path: %s "
-                    "(not caching — will retry next time)",
-                    effective_model,
-                    model_path,
-                )
+        model_path = await self._resolve_model_path(effective_model)
 
         log.debug("Piper TTS: model=%s, text_len=%d", model_path, len(text))
 
+        # Prefer the persistent worker (model already loaded); fall back to
+        # spawning the CLI if it is unavailable or dies mid-request.
+        if os.path.isfile(model_path):
+            daemon = await self._get_piper_daemon(model_path)
+            if daemon is not None:
+                t0 = time.monotonic()
+                audio = await daemon.synthesize(text)
+                if audio and len(audio) > 44:
+                    log.debug(
+                        "Piper worker produced %d bytes in %.3fs",
+                        len(audio), time.monotonic() - t0,
+                    )
+                    return audio
+
+        proc = None
         try:
             t0 = time.monotonic()
-            result = subprocess.run(
-                ["piper", "--model", model_path, "--output_file", "-"],
-                input=text.encode("utf-8"),
-                capture_output=True,
-                timeout=60,
+            proc = await asyncio.create_subprocess_exec(
+                "piper", "--model", model_path, "--output_file", "-",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(text.encode("utf-8")), timeout=60
             )
             elapsed = time.monotonic() - t0
-            if result.returncode == 0 and len(result.stdout) > 44:
+            if proc.returncode == 0 and len(stdout) > 44:
                 log.debug(
                     "Piper produced %d bytes in %.3fs (rc=0)",
-                    len(result.stdout), elapsed,
+                    len(stdout), elapsed,
                 )
-                return result.stdout  # WAV format
-            stderr_text = result.stderr.decode(errors="replace")
+                return stdout  # WAV format
+            stderr_text = stderr.decode(errors="replace")
             log.warning(
                 "Piper produced no audio (rc=%d, %.3fs, stderr=%s)",
-                result.returncode, elapsed, stderr_text[:500],
+                proc.returncode, elapsed, stderr_text[:500],
             )
-            if result.returncode != 0:
+            if proc.returncode != 0:
                 log.debug("Full Piper stderr: %s", stderr_text)
         except FileNotFoundError:
             log.warning("piper CLI not found, falling back to espeak-ng")
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             log.warning("Piper TTS timed out after 60s")
+            await _kill_process(proc)
+        except BaseException:
+            # Cancelled while waiting: don't leave the CLI running orphaned
+            await _kill_process(proc)
+            raise
 
-        return self._synthesize_espeak_fallback(text)
+        return await self._synthesize_espeak_fallback(text)
 
-    def _synthesize_espeak_fallback(self, text: str) -> bytes | None:
+    async def _synthesize_espeak_fallback(self, text: str) -> bytes | None:
         """Ultimate fallback: use espeak via subprocess."""
-        import subprocess
-
         log.warning(
             "Falling back to espeak-ng (Piper unavailable), "
             "output will sound robotic — text=%r",
             text[:200],
         )
+        proc = None
         try:
-            result = subprocess.run(
-                ["espeak-ng", "--stdout", "-s", "150", text],
-                capture_output=True,
-                timeout=30,
+            proc = await asyncio.create_subprocess_exec(
+                "espeak-ng", "--stdout", "-s", "150", text,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            if result.returncode == 0 and result.stdout:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+            if proc.returncode == 0 and stdout:
                 log.warning(
                     "espeak-ng fallback produced %d bytes "
                     "(check Piper model configuration)",
-                    len(result.stdout),
+                    len(stdout),
                 )
-                return result.stdout
+                return stdout
             log.warning(
-                "espeak-ng fallback failed (rc=%d)", result.returncode
+                "espeak-ng fallback failed (rc=%d)", proc.returncode
             )
         except FileNotFoundError:
             log.warning("espeak-ng not installed — no TTS fallback available")
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             log.warning("espeak-ng fallback timed out after 30s")
+            await _kill_process(proc)
+        except BaseException:
+            await _kill_process(proc)
+            raise
         return None
 
     @staticmethod
@@ -544,10 +875,4 @@ class TextToSpeech:
         pcm_data: bytes, sample_rate: int = 16000, channels: int = 1
     ) -> bytes:
         """Wrap raw 16-bit PCM data in a WAV container."""
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(channels)
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(pcm_data)
-        return wav_buffer.getvalue()
+        return _wav_header(len(pcm_data), sample_rate, channels) + pcm_data
@@ -24,12 +24,108 @@ log = logging.getLogger(__name__)
 DISCORD_API_BASE = "https://discord.com/api/v10"
 
 
+def create_http_session() -> aiohttp.ClientSession:
+    """Create a keep-alive HTTP session for voice-message REST calls.
+
+    Each voicemail makes three Discord API hops plus a CDN upload; a
+    long-lived session with a tuned connector reuses TCP/TLS connections
+    and cached DNS across them and across messages.  Authorization is
+    deliberately *not* set as a default header since the upload goes to a
+    non-Discord host.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=32, ttl_dns_cache=300, keepalive_timeout=75,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def _waveform_msq_thresholds() -> np.ndarray:
+    """Smallest float32 mean-square at which each bar level 1-255 starts.
+
+    Waveform bars are ``min(255, int(rms * 255 * 4 / 32768))`` in float32 —
+    scaled to 0-255 with amplification for visibility.  That is monotonic
+    in the mean-square, so a bar is the count of thresholds it reaches.
+    Each threshold is found by bisecting float32 bit patterns (which sort
+    like the values for non-negative floats), so the table reproduces the
+    float32 formula exactly, including rounding at level boundaries.
+    """
+    scale = np.float32(255 * 4 / 32768)
+    levels = np.arange(1, 256, dtype=np.int64)
+    lo = np.zeros(255, dtype=np.int64)
+    hi = np.full(255, np.float32(32768.0**2).view(np.int32), dtype=np.int64)
+    while (lo < hi).any():
+        mid = (lo + hi) // 2
+        msq = mid.astype(np.uint32).view(np.float32)
+        reached = (np.sqrt(msq) * scale).astype(np.int64) >= levels
+        hi = np.where(reached, mid, hi)
+        lo = np.where(reached, lo, mid + 1)
+    return hi.astype(np.uint32).view(np.float32)
+
+
+_WAVEFORM_MSQ_THRESHOLDS = _waveform_msq_thresholds()
+
+# Sample rates libopus can encode natively
+_OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+def _encode_ogg_opus_inprocess(wav_bytes: bytes) -> bytes:
+    """Encode WAV to OGG Opus with libopus via PyOgg (no subprocess).
+
+    Rates libopus doesn't support (e.g. Piper's 22050 Hz) are resampled
+    to 48 kHz first.  Raises on any failure so the caller can fall back
+    to ffmpeg.
+    """
+    import pyogg
+
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        n_channels = wf.getnchannels()
+        sample_rate = wf.getframerate()
+        if wf.getsampwidth() != 2:
+            raise ValueError("only 16-bit PCM is supported")
+        pcm = wf.readframes(wf.getnframes())
+
+    if sample_rate not in _OPUS_SAMPLE_RATES:
+        from math import gcd
+
+        from scipy.signal import resample_poly
+
+        g = gcd(48000, sample_rate)
+        samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, n_channels)
+        resampled = resample_poly(samples, 48000 // g, sample_rate // g, axis=0)
+        pcm = np.clip(resampled, -32768, 32767).astype(np.int16).tobytes()
+        sample_rate = 48000
+
+    encoder = pyogg.OpusBufferedEncoder()
+    encoder.set_application("voip")
+    encoder.set_sampling_frequency(sample_rate)
+    encoder.set_channels(n_channels)
+    encoder.set_frame_size(20)  # ms
+
+    out = io.BytesIO()
+    writer = pyogg.OggOpusWriter(out, encoder)
+    writer.write(memoryview(bytearray(pcm)))
+    writer.close()
+    return out.getvalue()
+
+
 async def wav_to_ogg_opus(wav_bytes: bytes) -> bytes | None:
-    """Convert WAV audio to OGG Opus format using ffmpeg.
+    """Convert WAV audio to OGG Opus format.
 
     Discord voice messages require ``.ogg`` files with Opus encoding
-    (not Vorbis).  Returns ``None`` on failure.
+    (not Vorbis).  Encodes in-process with libopus when PyOgg is
+    installed, otherwise (or on failure) pipes through ffmpeg.
+    Returns ``None`` on failure.
     """
+    try:
+        loop = asyncio.get_running_loop()
+        ogg = await loop.run_in_executor(None, _encode_ogg_opus_inprocess, wav_bytes)
+        log.debug("WAV->OGG (libopus): %d -> %d bytes", len(wav_bytes), len(ogg))
+        return ogg
+    except ImportError:
+        pass
+    except Exception:
+        log.debug("In-process Opus encoding failed, using ffmpeg", exc_info=True)
+
     proc = await asyncio.create_subprocess_exec(
         "ffmpeg", "-i", "pipe:0",
         "-c:a", "libopus", "-b:a", "64k",
@@ -50,6 +146,54 @@ async def wav_to_ogg_opus(wav_bytes: bytes) -> bytes | None:
     return stdout
 
 
+def _waveform_from_frames(raw: bytes, n_channels: int, num_bars: int) -> str:
+    """Compute base64 waveform bars from raw 16-bit PCM frames."""
+    samples = np.frombuffer(raw, dtype=np.int16)
+
+    # Convert stereo to mono
+    if n_channels == 2 and len(samples) % 2 == 0:
+        samples = samples.reshape(-1, 2).mean(axis=1).astype(np.int16)
+
+    if len(samples) == 0:
+        return base64.b64encode(bytes(num_bars)).decode()
+
+    # One (bars x chunk) view and a single RMS reduction across rows.
+    # Any ragged tail is dropped; clips shorter than num_bars pad with 0.
+    chunk_size = max(1, len(samples) // num_bars)
+    n_rows = min(num_bars, len(samples) // chunk_size)
+    chunks = samples[: n_rows * chunk_size].reshape(n_rows, chunk_size)
+    chunks = chunks.astype(np.float32)
+    mean_sq = np.mean(chunks * chunks, axis=1)
+    # Quantize straight from mean-square by counting crossed thresholds —
+    # no per-bar sqrt, scale, or clamp
+    bars = np.zeros(num_bars, dtype=np.uint8)
+    bars[:n_rows] = np.searchsorted(_WAVEFORM_MSQ_THRESHOLDS, mean_sq, side="right")
+
+    return base64.b64encode(bars.tobytes()).decode()
+
+
+def analyze_wav(wav_bytes: bytes, num_bars: int = 256) -> tuple[float, str]:
+    """Return ``(duration_secs, waveform_b64)`` from a single WAV parse.
+
+    Equivalent to calling :func:`get_wav_duration` and
+    :func:`calculate_waveform`, but reads the header and frames once.
+    """
+    try:
+        with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+            n_channels = wf.getnchannels()
+            n_frames = wf.getnframes()
+            duration = n_frames / wf.getframerate()
+            raw = wf.readframes(n_frames)
+    except Exception:
+        log.exception("Failed to parse WAV for voice message")
+        return 1.0, base64.b64encode(bytes(num_bars)).decode()
+    try:
+        return duration, _waveform_from_frames(raw, n_channels, num_bars)
+    except Exception:
+        log.exception("Failed to calculate waveform")
+        return duration, base64.b64encode(bytes(num_bars)).decode()
+
+
 def calculate_waveform(wav_bytes: bytes, num_bars: int = 256) -> str:
     """Calculate waveform visualization data from WAV audio.
 
@@ -60,30 +204,7 @@ def calculate_waveform(wav_bytes: bytes, num_bars: int = 256) -> str:
         with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
             n_channels = wf.getnchannels()
             raw = wf.readframes(wf.getnframes())
-            samples = np.frombuffer(raw, dtype=np.int16)
-
-        # Convert stereo to mono
-        if n_channels == 2 and len(samples) % 2 == 0:
-            samples = samples.reshape(-1, 2).mean(axis=1).astype(np.int16)
-
-        if len(samples) == 0:
-            return base64.b64encode(bytes(num_bars)).decode()
-
-        chunk_size = max(1, len(samples) // num_bars)
-        bars = []
-        for i in range(num_bars):
-            start = i * chunk_size
-            end = min(start + chunk_size, len(samples))
-            if start >= len(samples):
-                bars.append(0)
-                continue
-            segment = samples[start:end].astype(np.float32)
-            rms = float(np.sqrt(np.mean(segment ** 2)))
-            # Scale to 0-255 with amplification for visibility
-            bar = min(255, int(rms / 32768 * 255 * 4))
-            bars.append(bar)
-
-        return base64.b64encode(bytes(bars)).decode()
+        return _waveform_from_frames(raw, n_channels, num_bars)
     except Exception:
         log.exception("Failed to calculate waveform")
         return base64.b64encode(bytes(num_bars)).decode()
@@ -7,24 +7,80 @@ Backed by JSON files in the data directory:
   - voice_config.json: global TTS provider + per-user voice preferences
 
 Bootstraps from AUTHORIZED_USER_IDS and ADMIN_USER_IDS env vars on first run.
-Uses fcntl file locking for safe concurrent access.
+Writes are atomic (tmp file + rename) and, when an event loop is running,
+coalesced: bursts of mutations within a short window produce one write per
+file.  Call ``flush()`` before shutdown to persist anything still pending.
 """
 
 from __future__ import annotations
 
-import fcntl
+import asyncio
+import functools
 import json
 import logging
+import os
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 log = logging.getLogger(__name__)
 
 ROLE_ADMIN = "admin"
 ROLE_USER = "user"
 
+# Delay before writing coalesced changes to disk (seconds)
+_FLUSH_DELAY = 0.1
+
+
+class UserRecord(NamedTuple):
+    """One authorized user joined with their routing and voice overrides."""
+
+    uid: int
+    role: str
+    added_by: str
+    agent_id: str | None
+    elevenlabs_voice_id: str | None
+    local_tts_model: str | None
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize to indented, key-sorted JSON bytes with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _int_keys(data: dict[str, Any], source: Path) -> dict[int, Any]:
+    """Convert JSON object keys (user IDs) to ints, skipping invalid ones."""
+    converted = {}
+    for k, v in data.items():
+        try:
+            converted[int(k)] = v
+        except ValueError:
+            log.warning("Ignoring non-numeric user ID %r in %s", k, source)
+    return converted
+
+
+def _str_keys(data: dict[int, Any]) -> dict[str, Any]:
+    """Convert int keys back to strings for JSON."""
+    return {str(k): v for k, v in data.items()}
+
 
 class AuthStore:
     """Persistent authorization and agent routing store."""
@@ -43,13 +99,32 @@ class AuthStore:
         self._voice_config_path = self._data_dir / "voice_config.json"
         self._default_agent_id = default_agent_id
 
-        # In-memory caches
-        self._users: dict[str, dict[str, Any]] = {}
-        self._routes: dict[str, dict[str, Any]] = {}
+        # In-memory caches, keyed by int user ID (stringified only on disk)
+        self._users: dict[int, dict[str, Any]] = {}
+        # Admin IDs mirroring _users for hot-path authorization checks
+        self._admin_ids: set[int] = set()
+        # Sorted view of _users keys, rebuilt lazily after membership changes
+        self._sorted_uids: list[int] | None = None
+        self._routes: dict[int, dict[str, Any]] = {}
+        # Flat user_id -> agent_id view of _routes for get_agent_id()
+        self._agent_ids: dict[int, str] = {}
         # guild_id (str) -> list of allowed channel_id (str)
         self._channels: dict[str, list[str]] = {}
-        # Voice config: {"global": {...}, "users": {uid: {...}}}
+        # Voice config: {"global": {...}, "users": {uid (int): {...}}}
         self._voice_config: dict[str, Any] = {"global": {}, "users": {}}
+        # Mirror of _voice_config["global"]["tts_provider"] for per-call reads
+        self._global_tts_provider: str | None = None
+
+        # Files with unsaved changes, written by the next flush
+        self._dirty: set[Path] = set()
+        self._flush_task: asyncio.Task | None = None
+        # Serializes file writes between the flush thread and flush()
+        self._write_lock = threading.Lock()
+        # Snapshot sequence numbers; a write older than what is already on
+        # disk for that path (e.g. a thread flush losing the race with the
+        # shutdown flush()) is skipped
+        self._snapshot_seq = 0
+        self._written_seq: dict[Path, int] = {}
 
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self._load_or_bootstrap(
@@ -58,34 +133,29 @@ class AuthStore:
         )
 
     # ------------------------------------------------------------------
-    # File I/O with locking
+    # File I/O
     # ------------------------------------------------------------------
 
     def _read_json(self, path: Path) -> dict:
         if not path.exists():
             return {}
         try:
-            with open(path, "r") as f:
-                fcntl.flock(f, fcntl.LOCK_SH)
-                try:
-                    data = json.load(f)
-                finally:
-                    fcntl.flock(f, fcntl.LOCK_UN)
-            return data
-        except (json.JSONDecodeError, OSError) as e:
+            return _loads(path.read_bytes())
+        except (ValueError, OSError) as e:
             log.warning("Failed to read %s: %s", path, e)
             return {}
 
-    def _write_json(self, path: Path, data: dict) -> None:
+    def _write_bytes(self, path: Path, raw: bytes) -> None:
         tmp = path.with_suffix(".tmp")
         try:
-            with open(tmp, "w") as f:
-                fcntl.flock(f, fcntl.LOCK_EX)
-                try:
-                    json.dump(data, f, indent=2, sort_keys=True)
-                    f.write("\n")
-                finally:
-                    fcntl.flock(f, fcntl.LOCK_UN)
+            buf = memoryview(raw)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while buf:
+                    buf = buf[os.write(fd, buf):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             tmp.rename(path)
         except OSError as e:
             log.error("Failed to write %s: %s", path, e)
@@ -104,7 +174,7 @@ class AuthStore:
         routes_data = self._read_json(self._routes_path)
 
         if users_data.get("users"):
-            self._users = users_data["users"]
+            self._users = _int_keys(users_data["users"], self._users_path)
             log.info(
                 "Loaded %d authorized user(s) from %s",
                 len(self._users), self._users_path,
@@ -113,15 +183,14 @@ class AuthStore:
             # Bootstrap from env vars
             now = datetime.now(timezone.utc).isoformat()
             for uid in bootstrap_admin_ids:
-                self._users[str(uid)] = {
+                self._users[uid] = {
                     "role": ROLE_ADMIN,
                     "added_by": "env_bootstrap",
                     "added_at": now,
                 }
             for uid in bootstrap_user_ids:
-                uid_str = str(uid)
-                if uid_str not in self._users:
-                    self._users[uid_str] = {
+                if uid not in self._users:
+                    self._users[uid] = {
                         "role": ROLE_USER,
                         "added_by": "env_bootstrap",
                         "added_at": now,
@@ -144,15 +213,17 @@ class AuthStore:
                     "application owner will be auto-added as admin on startup."
                 )
             self._save_users()
+        self._rebuild_id_sets()
 
         if routes_data.get("routes"):
-            self._routes = routes_data["routes"]
+            self._routes = _int_keys(routes_data["routes"], self._routes_path)
             log.info(
                 "Loaded %d agent route(s) from %s",
                 len(self._routes), self._routes_path,
             )
         else:
             self._save_routes()
+        self._rebuild_agent_ids()
 
         channels_data = self._read_json(self._channels_path)
         if channels_data.get("guilds"):
@@ -169,10 +240,11 @@ class AuthStore:
         if voice_cfg:
             self._voice_config = {
                 "global": voice_cfg.get("global", {}),
-                "users": voice_cfg.get("users", {}),
+                "users": _int_keys(voice_cfg.get("users", {}), self._voice_config_path),
             }
+            self._global_tts_provider = self._voice_config["global"].get("tts_provider")
             user_count = len(self._voice_config["users"])
-            provider = self._voice_config["global"].get("tts_provider")
+            provider = self._global_tts_provider
             if user_count or provider:
                 log.info(
                     "Loaded voice config: provider=%s, %d user override(s)",
@@ -181,31 +253,109 @@ class AuthStore:
         else:
             self._save_voice_config()
 
+    def _snapshot(self, path: Path) -> dict:
+        """Return the serializable document for one of the store's files."""
+        if path == self._users_path:
+            return {"users": _str_keys(self._users)}
+        if path == self._routes_path:
+            return {"routes": _str_keys(self._routes)}
+        if path == self._channels_path:
+            return {"guilds": self._channels}
+        return {
+            "global": self._voice_config["global"],
+            "users": _str_keys(self._voice_config["users"]),
+        }
+
+    def _mark_dirty(self, path: Path) -> None:
+        """Schedule ``path`` to be written, coalescing bursts of changes.
+
+        Outside an event loop (startup, scripts) the write happens
+        immediately.
+        """
+        self._dirty.add(path)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(_FLUSH_DELAY)
+        # Serialize on the loop (consistent with in-memory state), then do the
+        # write + fsync in a worker thread so it can't stall the gateway.
+        # Changes made while a write is in flight are picked up next pass.
+        while self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            await asyncio.to_thread(self._write_all, self._serialize(dirty))
+
+    def _serialize(self, paths: set[Path]) -> list[tuple[Path, int, bytes]]:
+        """Snapshot ``paths`` as (path, sequence number, JSON bytes)."""
+        docs = []
+        for path in paths:
+            self._snapshot_seq += 1
+            docs.append((path, self._snapshot_seq, _dumps(self._snapshot(path))))
+        return docs
+
+    def _write_all(self, docs: list[tuple[Path, int, bytes]]) -> None:
+        with self._write_lock:
+            for path, seq, raw in docs:
+                if seq <= self._written_seq.get(path, 0):
+                    continue
+                self._write_bytes(path, raw)
+                self._written_seq[path] = seq
+
+    def flush(self) -> None:
+        """Write all files with pending changes to disk."""
+        dirty, self._dirty = self._dirty, set()
+        self._write_all(self._serialize(dirty))
+
+    def _rebuild_id_sets(self) -> None:
+        self._sorted_uids = None
+        self._admin_ids = {
+            uid for uid, u in self._users.items() if u.get("role") == ROLE_ADMIN
+        }
+
+    def _rebuild_agent_ids(self) -> None:
+        self._agent_ids = {
+            uid: route["agent_id"]
+            for uid, route in self._routes.items()
+            if route.get("agent_id")
+        }
+
     def _save_users(self) -> None:
-        self._write_json(self._users_path, {"users": self._users})
+        self._mark_dirty(self._users_path)
 
     def _save_routes(self) -> None:
-        self._write_json(self._routes_path, {"routes": self._routes})
+        self._mark_dirty(self._routes_path)
 
     def _save_channels(self) -> None:
-        self._write_json(self._channels_path, {"guilds": self._channels})
+        self._mark_dirty(self._channels_path)
 
     def _save_voice_config(self) -> None:
-        self._write_json(self._voice_config_path, self._voice_config)
+        self._mark_dirty(self._voice_config_path)
 
     def reload(self) -> None:
-        """Reload from disk (useful after external edits)."""
+        """Reload from disk (useful after external edits).
+
+        Discards any unflushed in-memory changes.
+        """
+        self._dirty.clear()
         users_data = self._read_json(self._users_path)
         routes_data = self._read_json(self._routes_path)
         channels_data = self._read_json(self._channels_path)
         voice_cfg = self._read_json(self._voice_config_path)
-        self._users = users_data.get("users", {})
-        self._routes = routes_data.get("routes", {})
+        self._users = _int_keys(users_data.get("users", {}), self._users_path)
+        self._rebuild_id_sets()
+        self._routes = _int_keys(routes_data.get("routes", {}), self._routes_path)
+        self._rebuild_agent_ids()
         self._channels = channels_data.get("guilds", {})
         self._voice_config = {
             "global": voice_cfg.get("global", {}),
-            "users": voice_cfg.get("users", {}),
+            "users": _int_keys(voice_cfg.get("users", {}), self._voice_config_path),
         }
+        self._global_tts_provider = self._voice_config["global"].get("tts_provider")
 
     # ------------------------------------------------------------------
     # User authorization
@@ -213,55 +363,82 @@ class AuthStore:
 
     def is_authorized(self, user_id: int) -> bool:
         """Check if a user is authorized. Fail-closed: empty store = deny all."""
-        return str(user_id) in self._users
+        return user_id in self._users
 
     def is_admin(self, user_id: int) -> bool:
         """Check if a user has admin role."""
-        entry = self._users.get(str(user_id))
-        return entry is not None and entry.get("role") == ROLE_ADMIN
+        return user_id in self._admin_ids
 
     def get_role(self, user_id: int) -> str | None:
         """Get a user's role, or None if not authorized."""
-        entry = self._users.get(str(user_id))
+        entry = self._users.get(user_id)
         return entry.get("role") if entry else None
 
-    def get_all_users(self) -> dict[str, dict[str, Any]]:
+    def get_all_users(self) -> dict[int, dict[str, Any]]:
         """Return a copy of all authorized users."""
         return dict(self._users)
 
+    def get_sorted_user_ids(self) -> list[int]:
+        """Return all authorized user IDs in ascending order (do not mutate)."""
+        if self._sorted_uids is None:
+            self._sorted_uids = sorted(self._users)
+        return self._sorted_uids
+
+    def snapshot_admin_view(self) -> list[UserRecord]:
+        """Return all users, sorted by ID, with agent and voice overrides joined in."""
+        users = self._users
+        voice_users = self._voice_config["users"]
+        records = []
+        for uid in self.get_sorted_user_ids():
+            info = users[uid]
+            voice = voice_users.get(uid, {})
+            records.append(UserRecord(
+                uid=uid,
+                role=info.get("role", ROLE_USER),
+                added_by=str(info.get("added_by", "unknown")),
+                agent_id=self._agent_ids.get(uid),
+                elevenlabs_voice_id=voice.get("elevenlabs_voice_id"),
+                local_tts_model=voice.get("local_tts_model"),
+            ))
+        return records
+
     @property
     def user_count(self) -> int:
         return len(self._users)
 
     @property
     def admin_count(self) -> int:
-        return sum(1 for u in self._users.values() if u.get("role") == ROLE_ADMIN)
+        return len(self._admin_ids)
 
     def add_user(
         self, user_id: int, role: str = ROLE_USER, added_by: int | str = "unknown"
     ) -> bool:
         """Add a user. Returns False if already exists."""
-        uid_str = str(user_id)
-        if uid_str in self._users:
+        if user_id in self._users:
             return False
-        self._users[uid_str] = {
+        self._users[user_id] = {
             "role": role,
             "added_by": str(added_by),
             "added_at": datetime.now(timezone.utc).isoformat(),
         }
+        self._sorted_uids = None
+        if role == ROLE_ADMIN:
+            self._admin_ids.add(user_id)
         self._save_users()
         log.info("Added user %s with role %s (by %s)", user_id, role, added_by)
         return True
 
     def remove_user(self, user_id: int) -> bool:
         """Remove a user. Returns False if not found."""
-        uid_str = str(user_id)
-        if uid_str not in self._users:
+        if user_id not in self._users:
             return False
-        del self._users[uid_str]
+        del self._users[user_id]
+        self._sorted_uids = None
+        self._admin_ids.discard(user_id)
         # Also remove any agent route and voice config
-        self._routes.pop(uid_str, None)
-        self._voice_config["users"].pop(uid_str, None)
+        self._routes.pop(user_id, None)
+        self._agent_ids.pop(user_id, None)
+        self._voice_config["users"].pop(user_id, None)
         self._save_users()
         self._save_routes()
         self._save_voice_config()
@@ -270,22 +447,22 @@ class AuthStore:
 
     def promote_user(self, user_id: int) -> bool:
         """Promote a user to admin. Returns False if not found or already admin."""
-        uid_str = str(user_id)
-        entry = self._users.get(uid_str)
+        entry = self._users.get(user_id)
         if not entry or entry.get("role") == ROLE_ADMIN:
             return False
         entry["role"] = ROLE_ADMIN
+        self._admin_ids.add(user_id)
         self._save_users()
         log.info("Promoted user %s to admin", user_id)
         return True
 
     def demote_user(self, user_id: int) -> bool:
         """Demote an admin to user. Returns False if not found or not admin."""
-        uid_str = str(user_id)
-        entry = self._users.get(uid_str)
+        entry = self._users.get(user_id)
         if not entry or entry.get("role") != ROLE_ADMIN:
             return False
         entry["role"] = ROLE_USER
+        self._admin_ids.discard(user_id)
         self._save_users()
         log.info("Demoted user %s to user", user_id)
         return True
@@ -302,31 +479,29 @@ class AuthStore:
 
     def get_agent_id(self, user_id: int) -> str:
         """Get the agent ID for a user, falling back to default."""
-        route = self._routes.get(str(user_id))
-        if route and route.get("agent_id"):
-            return route["agent_id"]
-        return self._default_agent_id
+        return self._agent_ids.get(user_id, self._default_agent_id)
 
     def set_agent_id(self, user_id: int, agent_id: str) -> None:
         """Set a per-user agent ID override."""
-        uid_str = str(user_id)
-        if uid_str not in self._routes:
-            self._routes[uid_str] = {}
-        self._routes[uid_str]["agent_id"] = agent_id
+        self._routes.setdefault(user_id, {})["agent_id"] = agent_id
+        if agent_id:
+            self._agent_ids[user_id] = agent_id
+        else:
+            self._agent_ids.pop(user_id, None)
         self._save_routes()
         log.info("Set agent_id for user %s to %s", user_id, agent_id)
 
     def clear_agent_id(self, user_id: int) -> bool:
         """Remove a per-user agent ID override. Returns False if none existed."""
-        uid_str = str(user_id)
-        if uid_str in self._routes:
-            del self._routes[uid_str]
+        if user_id in self._routes:
+            del self._routes[user_id]
+            self._agent_ids.pop(user_id, None)
             self._save_routes()
             log.info("Cleared agent_id override for user %s", user_id)
             return True
         return False
 
-    def get_all_routes(self) -> dict[str, dict[str, Any]]:
+    def get_all_routes(self) -> dict[int, dict[str, Any]]:
         """Return a copy of all agent routes."""
         return dict(self._routes)
 
@@ -334,6 +509,11 @@ class AuthStore:
     def default_agent_id(self) -> str:
         return self._default_agent_id
 
+    @functools.cached_property
+    def default_agent_line(self) -> str:
+        """Agent line shown in user listings for users without an override."""
+        return f"\nAgent: `{self._default_agent_id}` (default)"
+
     # ------------------------------------------------------------------
     # Channel allowlist (per-guild)
     # ------------------------------------------------------------------
@@ -356,43 +536,52 @@ class AuthStore:
         gid = str(guild_id)
         return [int(cid) for cid in self._channels.get(gid, [])]
 
-    def add_allowed_channel(self, guild_id: int, channel_id: int) -> bool:
-        """Add a channel to the guild's allowlist. Returns False if already present."""
+    def add_allowed_channel(self, guild_id: int, channel_id: int) -> int | None:
+        """Add a channel to the guild's allowlist.
+
+        Returns the new allowlist size, or None if the channel was already present.
+        """
         gid = str(guild_id)
         cid = str(channel_id)
         if gid not in self._channels:
             self._channels[gid] = []
         if cid in self._channels[gid]:
-            return False
+            return None
         self._channels[gid].append(cid)
         self._save_channels()
         log.info("Added channel %s to allowlist for guild %s", channel_id, guild_id)
-        return True
+        return len(self._channels[gid])
+
+    def remove_allowed_channel(self, guild_id: int, channel_id: int) -> int | None:
+        """Remove a channel from the guild's allowlist.
 
-    def remove_allowed_channel(self, guild_id: int, channel_id: int) -> bool:
-        """Remove a channel from the guild's allowlist. Returns False if not found."""
+        Returns the remaining allowlist size (0 = all channels allowed), or
+        None if the channel was not in the list.
+        """
         gid = str(guild_id)
         cid = str(channel_id)
         allowed = self._channels.get(gid, [])
         if cid not in allowed:
-            return False
+            return None
         allowed.remove(cid)
         # If the list is now empty, remove the guild entry entirely
         if not allowed:
             del self._channels[gid]
         self._save_channels()
         log.info("Removed channel %s from allowlist for guild %s", channel_id, guild_id)
-        return True
+        return len(allowed)
 
-    def clear_allowed_channels(self, guild_id: int) -> bool:
-        """Clear all channel restrictions for a guild (allows all). Returns False if already clear."""
-        gid = str(guild_id)
-        if gid not in self._channels:
-            return False
-        del self._channels[gid]
+    def clear_allowed_channels(self, guild_id: int) -> int | None:
+        """Clear all channel restrictions for a guild (allows all).
+
+        Returns the number of channels removed, or None if already clear.
+        """
+        removed = self._channels.pop(str(guild_id), None)
+        if removed is None:
+            return None
         self._save_channels()
         log.info("Cleared channel allowlist for guild %s", guild_id)
-        return True
+        return len(removed)
 
     # ------------------------------------------------------------------
     # Voice configuration (global provider + per-user voice)
@@ -400,17 +589,19 @@ class AuthStore:
 
     def get_global_tts_provider(self) -> str | None:
         """Get the globally overridden TTS provider, or None for env default."""
-        return self._voice_config["global"].get("tts_provider")
+        return self._global_tts_provider
 
     def set_global_tts_provider(self, provider: str) -> None:
         """Set the global TTS provider override ('local' or 'elevenlabs')."""
         self._voice_config["global"]["tts_provider"] = provider
+        self._global_tts_provider = provider
         self._save_voice_config()
         log.info("Global TTS provider set to %s", provider)
 
     def clear_global_tts_provider(self) -> None:
         """Clear the global provider override (revert to env default)."""
         self._voice_config["global"].pop("tts_provider", None)
+        self._global_tts_provider = None
         self._save_voice_config()
         log.info("Global TTS provider override cleared (using env default)")
 
@@ -422,7 +613,7 @@ class AuthStore:
           - local_tts_model: Piper model name
         Empty dict if no overrides set.
         """
-        return dict(self._voice_config["users"].get(str(user_id), {}))
+        return dict(self._voice_config["users"].get(user_id, {}))
 
     def set_user_voice(
         self,
@@ -432,10 +623,7 @@ class AuthStore:
         local_tts_model: str | None = None,
     ) -> None:
         """Set per-user voice preference for one or both providers."""
-        uid_str = str(user_id)
-        if uid_str not in self._voice_config["users"]:
-            self._voice_config["users"][uid_str] = {}
-        entry = self._voice_config["users"][uid_str]
+        entry = self._voice_config["users"].setdefault(user_id, {})
         if elevenlabs_voice_id is not None:
             entry["elevenlabs_voice_id"] = elevenlabs_voice_id
         if local_tts_model is not None:
@@ -445,17 +633,16 @@ class AuthStore:
 
     def clear_user_voice(self, user_id: int) -> bool:
         """Clear all voice preferences for a user. Returns False if none existed."""
-        uid_str = str(user_id)
-        if uid_str not in self._voice_config["users"]:
+        if user_id not in self._voice_config["users"]:
             return False
-        del self._voice_config["users"][uid_str]
+        del self._voice_config["users"][user_id]
         self._save_voice_config()
         log.info("Cleared voice config for user %s", user_id)
         return True
 
     def get_effective_tts_provider(self, env_default: str) -> str:
         """Get the effective TTS provider (global override or env default)."""
-        return self.get_global_tts_provider() or env_default
+        return self._global_tts_provider or env_default
 
     def get_effective_voice_id(self, user_id: int, env_default: str) -> str:
         """Get the effective ElevenLabs voice ID for a user."""
@@ -467,7 +654,7 @@ class AuthStore:
         prefs = self.get_user_voice(user_id)
         return prefs.get("local_tts_model") or env_default
 
-    def get_all_voice_configs(self) -> dict[str, dict[str, str]]:
+    def get_all_voice_configs(self) -> dict[int, dict[str, str]]:
         """Return a copy of all per-user voice configs."""
         return {k: dict(v) for k, v in self._voice_config["users"].items()}
 
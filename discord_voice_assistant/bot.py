@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any
 
 import discord
 from discord.ext import commands
@@ -14,6 +17,7 @@ from discord_voice_assistant.commands.admin import AdminCommands
 from discord_voice_assistant.commands.general import GeneralCommands
 from discord_voice_assistant.commands.voice import VoiceCommands
 from discord_voice_assistant.commands.voice_config import VoiceConfigCommands
+from discord_voice_assistant.config import RuntimeSettings
 from discord_voice_assistant.integrations.webhook_server import WebhookServer
 from discord_voice_assistant.voice_bridge import VoiceBridgeClient
 from discord_voice_assistant.voice_manager import VoiceManager
@@ -23,8 +27,8 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
-# How often to check if the bridge is still healthy (seconds)
-_BRIDGE_HEALTH_INTERVAL = 30
+# Hash of the last successfully synced command tree (in DATA_DIR)
+_COMMAND_HASH_FILE = "command_tree.hash"
 
 
 class VoiceAssistantBot(commands.Bot):
@@ -46,6 +50,7 @@ class VoiceAssistantBot(commands.Bot):
         )
 
         self.config = config
+        self.runtime = RuntimeSettings(config)
         self.bridge = VoiceBridgeClient(config.voice_bridge.url)
 
         # Persistent auth store — bootstraps from env vars on first run
@@ -59,34 +64,93 @@ class VoiceAssistantBot(commands.Bot):
 
         self.voice_manager = VoiceManager(self, config, self.bridge)
         self._webhook_server: WebhookServer | None = None
-        self._bridge_health_task: asyncio.Task | None = None
+        # Application owner IDs, fetched during setup_hook
+        self._owner_ids: frozenset[int] | None = None
+        # Startup work left running in the background (see setup_hook)
+        self._startup_tasks: set[asyncio.Task] = set()
+
+    async def setup_hook(self) -> None:
+        """One-time startup work, run after login and before the gateway connects.
+
+        Unlike on_ready, this is not repeated when the gateway reconnects.
+        """
+        await self._bootstrap_owner()
+
+        await self.add_cog(GeneralCommands(self))
+        await self.add_cog(VoiceCommands(self))
+        await self.add_cog(AdminCommands(self))
+        await self.add_cog(VoiceConfigCommands(self))
+
+        self.bridge.register_state_callback(self._on_bridge_state)
+
+        # The bridge handshake and Whisper preload can take many seconds;
+        # run them in the background so the gateway IDENTIFY isn't held up
+        self._start_background(self._connect_bridge(), "bridge connect")
+        self._start_background(self.voice_manager.initialize(), "voice manager init")
+
+        # Command sync and owner lookup are short; overlap them with each other
+        results = await asyncio.gather(
+            self._sync_commands(),
+            self._get_owner_ids(),
+            return_exceptions=True,
+        )
+        steps = ("command sync", "owner lookup")
+        for step, result in zip(steps, results):
+            if isinstance(result, BaseException):
+                log.error("Startup step failed: %s", step, exc_info=result)
+
+    def _start_background(self, coro: Coroutine[Any, Any, None], step: str) -> None:
+        """Run a startup step as a task, logging its failure when it ends."""
+        task = asyncio.create_task(coro, name=f"startup: {step}")
+        self._startup_tasks.add(task)
+
+        def _done(t: asyncio.Task) -> None:
+            self._startup_tasks.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                log.error("Startup step failed: %s", step, exc_info=t.exception())
+
+        task.add_done_callback(_done)
 
     async def on_ready(self) -> None:
         log.info("Logged in as %s (ID: %s)", self.user, self.user.id)
         log.info("Connected to %d guild(s)", len(self.guilds))
 
-        # Auto-bootstrap: if the auth store is empty, add the application owner
-        # as an admin so the bot is immediately usable (solves the chicken-and-egg
-        # problem where no one is authorized and no one can authorize themselves).
-        if self.auth_store.user_count == 0:
+        # Start webhook server for proactive voice
+        if self.config.webhook.enabled and self._webhook_server is None:
+            self._webhook_server = WebhookServer(self, self.config)
             try:
-                app_info = await self.application_info()
-                owner_id = app_info.owner.id
-                self.auth_store.add_user(owner_id, role="admin", added_by="auto_owner")
-                log.info(
-                    "Auto-added application owner %s (%s) as admin "
-                    "(auth store was empty)",
-                    app_info.owner, owner_id,
-                )
+                await self._webhook_server.start()
             except Exception:
-                log.warning(
-                    "Could not auto-add application owner — auth store remains "
-                    "empty (all users rejected). Use /voice-add as bot owner "
-                    "to bootstrap.",
-                    exc_info=True,
-                )
-
-        # Connect to the Node.js voice bridge
+                log.exception("Failed to start webhook server")
+                self._webhook_server = None
+
+    async def _bootstrap_owner(self) -> None:
+        """Add the application owner as admin if the auth store is empty.
+
+        Solves the chicken-and-egg problem where no one is authorized and no
+        one can authorize themselves.
+        """
+        if self.auth_store.user_count != 0:
+            return
+        try:
+            app_info = await self.application_info()
+            owner_id = app_info.owner.id
+            self.auth_store.add_user(owner_id, role="admin", added_by="auto_owner")
+            log.info(
+                "Auto-added application owner %s (%s) as admin "
+                "(auth store was empty)",
+                app_info.owner, owner_id,
+            )
+        except Exception:
+            log.warning(
+                "Could not auto-add application owner — auth store remains "
+                "empty (all users rejected). Use /voice-add as bot owner "
+                "to bootstrap.",
+                exc_info=True,
+            )
+
+    async def _connect_bridge(self) -> None:
+        """Connect to the Node.js voice bridge (reconnection is automatic)."""
         await self.bridge.start()
         try:
             await self.bridge.wait_connected(timeout=15.0)
@@ -98,49 +162,75 @@ class VoiceAssistantBot(commands.Bot):
                 self.config.voice_bridge.url,
             )
 
-        await self.voice_manager.initialize()
-
-        # Start webhook server for proactive voice
-        if self.config.webhook.enabled and self._webhook_server is None:
-            self._webhook_server = WebhookServer(self, self.config)
-            try:
-                await self._webhook_server.start()
-            except Exception:
-                log.exception("Failed to start webhook server")
-                self._webhook_server = None
-
-        # Register cogs (only on first ready — reconnects also trigger on_ready)
-        if not self.cogs:
-            await self.add_cog(GeneralCommands(self))
-            await self.add_cog(VoiceCommands(self))
-            await self.add_cog(AdminCommands(self))
-            await self.add_cog(VoiceConfigCommands(self))
+    def _command_tree_hash(self) -> str:
+        """Hash the command payload that tree.sync() would upload."""
+        payload = {
+            "application_id": self.application_id,
+            "commands": sorted(
+                (cmd.to_dict(self.tree) for cmd in self.tree.get_commands()),
+                key=lambda c: c["name"],
+            ),
+        }
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2s(raw.encode("utf-8")).hexdigest()
 
-        # Sync slash commands
+    async def _sync_commands(self) -> None:
+        """Sync slash commands, skipping the upload if nothing has changed."""
+        hash_path = self.config.data_dir / _COMMAND_HASH_FILE
         try:
+            tree_hash = self._command_tree_hash()
+            if not self.config.discord.force_command_sync:
+                try:
+                    if hash_path.read_text().strip() == tree_hash:
+                        log.info("Slash commands unchanged — skipping sync")
+                        return
+                except OSError:
+                    pass
             synced = await self.tree.sync()
             log.info("Synced %d slash command(s)", len(synced))
         except Exception:
             log.exception("Failed to sync slash commands")
+            return
+        try:
+            hash_path.write_text(tree_hash + "\n")
+        except OSError as e:
+            log.warning("Failed to write %s: %s", hash_path, e)
 
-        # Start bridge health monitor
-        if self._bridge_health_task is None or self._bridge_health_task.done():
-            self._bridge_health_task = asyncio.create_task(
-                self._monitor_bridge_health(), name="bridge-health-monitor"
-            )
+    def _on_bridge_state(self, connected: bool) -> None:
+        """Log bridge disconnects for observability (reconnection is automatic)."""
+        if not connected:
+            log.warning("Voice bridge disconnected — reconnecting")
 
-    async def _monitor_bridge_health(self) -> None:
-        """Periodically log bridge connection status for observability."""
-        while True:
-            try:
-                await asyncio.sleep(_BRIDGE_HEALTH_INTERVAL)
-                if not self.bridge.is_connected:
-                    log.warning(
-                        "Voice bridge is disconnected (reconnect attempt %d)",
-                        self.bridge.reconnect_attempts,
-                    )
-            except asyncio.CancelledError:
-                return
+    async def _get_owner_ids(self) -> frozenset[int]:
+        """Return the application owner IDs (team members for team-owned apps)."""
+        if self._owner_ids is None:
+            if self.owner_id is not None:
+                self._owner_ids = frozenset((self.owner_id,))
+            elif self.owner_ids:
+                self._owner_ids = frozenset(self.owner_ids)
+            else:
+                app = await self.application_info()
+                if app.team:
+                    self._owner_ids = frozenset(m.id for m in app.team.members)
+                else:
+                    self._owner_ids = frozenset((app.owner.id,))
+        return self._owner_ids
+
+    def is_voice_admin_cached(self, user_id: int) -> bool:
+        """Synchronous admin check against the store and the prefetched owner IDs.
+
+        A False result is only definitive once the owner IDs have loaded;
+        use is_voice_admin() for the authoritative answer.
+        """
+        if self.auth_store.is_admin(user_id):
+            return True
+        return self._owner_ids is not None and user_id in self._owner_ids
+
+    async def is_voice_admin(self, user_id: int) -> bool:
+        """Return True if the user is an auth-store admin or an application owner."""
+        if self.auth_store.is_admin(user_id):
+            return True
+        return user_id in await self._get_owner_ids()
 
     async def on_voice_state_update(
         self,
@@ -152,16 +242,20 @@ class VoiceAssistantBot(commands.Bot):
         # Ignore our own voice state changes
         if member.id == self.user.id:
             return
+        # Mute/deafen/stream toggles don't change channel membership, which
+        # is all the voice manager reacts to
+        if before.channel == after.channel:
+            return
 
         await self.voice_manager.handle_voice_state_update(member, before, after)
 
     async def close(self) -> None:
         log.info("Shutting down voice assistant...")
-        if self._bridge_health_task:
-            self._bridge_health_task.cancel()
-            self._bridge_health_task = None
+        for task in list(self._startup_tasks):
+            task.cancel()
         if self._webhook_server:
             await self._webhook_server.stop()
         await self.voice_manager.cleanup()
         await self.bridge.stop()
+        self.auth_store.flush()
         await super().close()
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from discord_voice_assistant.commands.checks import admin_only, handle_command_error
 from discord_voice_assistant.commands.voice_config import (
-    _get_voice_list_for_provider,
+    _match_voices,
     _voice_display_name,
 )
 
@@ -19,17 +23,73 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+_ROLE_BADGES = {"admin": "\U0001f6e1\ufe0f", "user": "\U0001f464"}
+_DEFAULT_ROLE_BADGE = _ROLE_BADGES["user"]
+_AGENT_LINE = "\nAgent: `{}`"
 
-async def _check_admin(bot: VoiceAssistantBot, interaction: discord.Interaction) -> bool:
-    """Return True if the caller is a bot owner or auth-store admin."""
-    if await bot.is_owner(interaction.user):
-        return True
-    if bot.auth_store.is_admin(interaction.user.id):
-        return True
-    await interaction.response.send_message(
-        "You need admin privileges to use this command.", ephemeral=True
-    )
-    return False
+# Admin commands allowed to do work concurrently; the rest wait their turn
+_ADMIN_MAX_CONCURRENCY = 4
+
+# Discord caps embed descriptions at 4096 characters
+_EMBED_DESCRIPTION_LIMIT = 4096
+
+
+# Gateway limit on user IDs per member query
+_QUERY_MEMBERS_MAX = 100
+
+
+async def _resolve_members(
+    guild: discord.Guild | None, user_ids: list[int]
+) -> dict[int, discord.Member]:
+    """Resolve guild members by ID, batching cache misses into gateway queries."""
+    if guild is None:
+        return {}
+    found: dict[int, discord.Member] = {}
+    missing: list[int] = []
+    for uid in user_ids:
+        member = guild.get_member(uid)
+        if member is not None:
+            found[uid] = member
+        else:
+            missing.append(uid)
+    for i in range(0, len(missing), _QUERY_MEMBERS_MAX):
+        batch = missing[i:i + _QUERY_MEMBERS_MAX]
+        try:
+            for member in await guild.query_members(
+                user_ids=batch, limit=len(batch), cache=True
+            ):
+                found[member.id] = member
+        except Exception:
+            log.debug("Member query failed for guild %s", guild.id, exc_info=True)
+            break
+    return found
+
+
+class _EmbedPaginator(discord.ui.View):
+    """Prev/next buttons for flipping through pre-built embed pages."""
+
+    def __init__(self, pages: list[discord.Embed], *, timeout: float = 300) -> None:
+        super().__init__(timeout=timeout)
+        self._pages = pages
+        self._index = 0
+        self._sync_buttons()
+
+    def _sync_buttons(self) -> None:
+        self.prev_page.disabled = self._index == 0
+        self.next_page.disabled = self._index >= len(self._pages) - 1
+
+    async def _show(self, interaction: discord.Interaction, index: int) -> None:
+        self._index = max(0, min(index, len(self._pages) - 1))
+        self._sync_buttons()
+        await interaction.response.edit_message(embed=self._pages[self._index], view=self)
+
+    @discord.ui.button(label="Prev", style=discord.ButtonStyle.secondary)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        await self._show(interaction, self._index - 1)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        await self._show(interaction, self._index + 1)
 
 
 class AdminCommands(commands.Cog):
@@ -37,6 +97,22 @@ class AdminCommands(commands.Cog):
 
     def __init__(self, bot: VoiceAssistantBot) -> None:
         self.bot = bot
+        self._sem = asyncio.Semaphore(_ADMIN_MAX_CONCURRENCY)
+
+    @contextlib.asynccontextmanager
+    async def _admin_slot(self) -> AsyncIterator[None]:
+        """Bound how many admin commands do work at once."""
+        if self._sem.locked():
+            log.warning(
+                "Admin command queued — %d already running", _ADMIN_MAX_CONCURRENCY
+            )
+        async with self._sem:
+            yield
+
+    async def cog_app_command_error(
+        self, interaction: discord.Interaction, error: app_commands.AppCommandError
+    ) -> None:
+        await handle_command_error(interaction, error)
 
     # ------------------------------------------------------------------
     # /voice-users — list all authorized users
@@ -46,68 +122,80 @@ class AdminCommands(commands.Cog):
         name="voice-users",
         description="List all authorized voice users and their roles",
     )
+    @admin_only()
     async def voice_users(self, interaction: discord.Interaction) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
-        store = self.bot.auth_store
-        users = store.get_all_users()
-        routes = store.get_all_routes()
+        await interaction.response.defer(ephemeral=True)
+        async with self._admin_slot():
+            store = self.bot.auth_store
+            records = store.snapshot_admin_view()
+
+            if not records:
+                await interaction.followup.send(
+                    "No authorized users configured. Use `/voice-add` to add users.",
+                    ephemeral=True,
+                )
+                return
 
-        if not users:
-            await interaction.response.send_message(
-                "No authorized users configured. Use `/voice-add` to add users.",
-                ephemeral=True,
-            )
-            return
-
-        embed = discord.Embed(
-            title="Authorized Voice Users",
-            color=discord.Color.blue(),
-            description=f"{len(users)} user(s) configured",
-        )
-
-        effective_provider = store.get_effective_tts_provider(
-            self.bot.config.tts.provider
-        )
-
-        for uid_str, info in sorted(users.items()):
-            uid = int(uid_str)
-            role = info.get("role", "user")
-            role_badge = "\U0001f6e1\ufe0f" if role == "admin" else "\U0001f464"
-
-            # Try to resolve the user name from the guild
-            member = interaction.guild.get_member(uid) if interaction.guild else None
-            name = member.display_name if member else f"User {uid}"
-
-            # Check for agent route
-            route = routes.get(uid_str)
-            agent_line = ""
-            if route and route.get("agent_id"):
-                agent_line = f"\nAgent: `{route['agent_id']}`"
-            else:
-                agent_line = f"\nAgent: `{store.default_agent_id}` (default)"
-
-            # Check for voice override
-            voice_prefs = store.get_user_voice(uid)
-            voice_line = ""
-            if effective_provider == "elevenlabs" and voice_prefs.get("elevenlabs_voice_id"):
-                vid = voice_prefs["elevenlabs_voice_id"]
-                vname = _voice_display_name("elevenlabs", vid)
-                voice_line = f"\nVoice: {vname}"
-            elif effective_provider == "local" and voice_prefs.get("local_tts_model"):
-                model = voice_prefs["local_tts_model"]
-                vname = _voice_display_name("local", model)
-                voice_line = f"\nVoice: {vname}"
-
-            added_by = info.get("added_by", "unknown")
-            embed.add_field(
-                name=f"{role_badge} {name}",
-                value=f"ID: `{uid}`\nRole: {role}{agent_line}{voice_line}\nAdded by: {added_by}",
-                inline=True,
+            effective_provider = store.get_effective_tts_provider(
+                self.bot.config.tts.provider
             )
+            default_agent_line = store.default_agent_line
+            members = await _resolve_members(interaction.guild, [r.uid for r in records])
+
+            blocks: list[str] = []
+            for rec in records:
+                member = members.get(rec.uid)
+                name = member.display_name if member else f"User {rec.uid}"
+
+                if rec.agent_id:
+                    agent_line = _AGENT_LINE.format(rec.agent_id)
+                else:
+                    agent_line = default_agent_line
+
+                # Voice override for the active provider
+                voice_line = ""
+                if effective_provider == "elevenlabs" and rec.elevenlabs_voice_id:
+                    vname = _voice_display_name("elevenlabs", rec.elevenlabs_voice_id)
+                    voice_line = f"\nVoice: {vname}"
+                elif effective_provider == "local" and rec.local_tts_model:
+                    vname = _voice_display_name("local", rec.local_tts_model)
+                    voice_line = f"\nVoice: {vname}"
+
+                blocks.append(
+                    f"{_ROLE_BADGES.get(rec.role, _DEFAULT_ROLE_BADGE)} **{name}**\n"
+                    f"ID: `{rec.uid}`\nRole: {rec.role}{agent_line}{voice_line}"
+                    f"\nAdded by: {rec.added_by}"
+                )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+            # Pack user blocks into as few description-only pages as fit
+            header = f"{len(records)} user(s) configured"
+            page_texts: list[list[str]] = [[]]
+            used = len(header)
+            for block in blocks:
+                cost = len(block) + 2  # "\n\n" separator
+                if page_texts[-1] and used + cost > _EMBED_DESCRIPTION_LIMIT:
+                    page_texts.append([])
+                    used = len(header)
+                page_texts[-1].append(block)
+                used += cost
+
+            pages: list[discord.Embed] = []
+            for i, page_blocks in enumerate(page_texts, start=1):
+                embed = discord.Embed(
+                    title="Authorized Voice Users",
+                    color=discord.Color.blue(),
+                    description="\n\n".join([header, *page_blocks]),
+                )
+                if len(page_texts) > 1:
+                    embed.set_footer(text=f"Page {i}/{len(page_texts)}")
+                pages.append(embed)
+
+            if len(pages) == 1:
+                await interaction.followup.send(embed=pages[0], ephemeral=True)
+            else:
+                await interaction.followup.send(
+                    embed=pages[0], view=_EmbedPaginator(pages), ephemeral=True
+                )
 
     # ------------------------------------------------------------------
     # /voice-add — add an authorized user
@@ -128,6 +216,7 @@ class AdminCommands(commands.Cog):
             app_commands.Choice(name="admin", value="admin"),
         ]
     )
+    @admin_only()
     async def voice_add(
         self,
         interaction: discord.Interaction,
@@ -135,28 +224,27 @@ class AdminCommands(commands.Cog):
         role: app_commands.Choice[str] | None = None,
         agent_id: str | None = None,
     ) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
+        await interaction.response.defer(ephemeral=True)
         store = self.bot.auth_store
-        chosen_role = role.value if role else "user"
+        async with self._admin_slot():
+            chosen_role = role.value if role else "user"
 
-        if not store.add_user(user.id, role=chosen_role, added_by=interaction.user.id):
-            await interaction.response.send_message(
-                f"{user.mention} is already authorized. Use `/voice-remove` first to re-add with different settings.",
-                ephemeral=True,
-            )
-            return
+            if not store.add_user(user.id, role=chosen_role, added_by=interaction.user.id):
+                await interaction.followup.send(
+                    f"{user.mention} is already authorized. Use `/voice-remove` first to re-add with different settings.",
+                    ephemeral=True,
+                )
+                return
 
-        # Set agent route if specified
-        if agent_id:
-            store.set_agent_id(user.id, agent_id)
+            # Set agent route if specified
+            if agent_id:
+                store.set_agent_id(user.id, agent_id)
 
-        agent_info = f" with agent `{agent_id}`" if agent_id else ""
-        await interaction.response.send_message(
-            f"Added {user.mention} as **{chosen_role}**{agent_info}.",
-            ephemeral=True,
-        )
+            agent_info = f" with agent `{agent_id}`" if agent_id else ""
+            await interaction.followup.send(
+                f"Added {user.mention} as **{chosen_role}**{agent_info}.",
+                ephemeral=True,
+            )
 
     # ------------------------------------------------------------------
     # /voice-remove — remove an authorized user
@@ -167,36 +255,35 @@ class AdminCommands(commands.Cog):
         description="Remove a user from the authorized voice users list",
     )
     @app_commands.describe(user="User to remove")
+    @admin_only()
     async def voice_remove(
         self,
         interaction: discord.Interaction,
         user: discord.User,
     ) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
+        await interaction.response.defer(ephemeral=True)
         store = self.bot.auth_store
+        async with self._admin_slot():
+            # Lockout protection: can't remove the last admin
+            if store.is_last_admin(user.id):
+                await interaction.followup.send(
+                    f"Cannot remove {user.mention} — they are the last admin. "
+                    "Promote another user to admin first.",
+                    ephemeral=True,
+                )
+                return
 
-        # Lockout protection: can't remove the last admin
-        if store.is_last_admin(user.id):
-            await interaction.response.send_message(
-                f"Cannot remove {user.mention} — they are the last admin. "
-                "Promote another user to admin first.",
-                ephemeral=True,
-            )
-            return
+            if not store.remove_user(user.id):
+                await interaction.followup.send(
+                    f"{user.mention} is not in the authorized list.",
+                    ephemeral=True,
+                )
+                return
 
-        if not store.remove_user(user.id):
-            await interaction.response.send_message(
-                f"{user.mention} is not in the authorized list.",
+            await interaction.followup.send(
+                f"Removed {user.mention} from authorized users.",
                 ephemeral=True,
             )
-            return
-
-        await interaction.response.send_message(
-            f"Removed {user.mention} from authorized users.",
-            ephemeral=True,
-        )
 
     # ------------------------------------------------------------------
     # /voice-promote — promote a user to admin
@@ -207,34 +294,33 @@ class AdminCommands(commands.Cog):
         description="Promote an authorized user to admin role",
     )
     @app_commands.describe(user="User to promote")
+    @admin_only()
     async def voice_promote(
         self,
         interaction: discord.Interaction,
         user: discord.User,
     ) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
+        await interaction.response.defer(ephemeral=True)
         store = self.bot.auth_store
+        async with self._admin_slot():
+            if not store.is_authorized(user.id):
+                await interaction.followup.send(
+                    f"{user.mention} is not authorized. Add them first with `/voice-add`.",
+                    ephemeral=True,
+                )
+                return
 
-        if not store.is_authorized(user.id):
-            await interaction.response.send_message(
-                f"{user.mention} is not authorized. Add them first with `/voice-add`.",
-                ephemeral=True,
-            )
-            return
+            if not store.promote_user(user.id):
+                await interaction.followup.send(
+                    f"{user.mention} is already an admin.",
+                    ephemeral=True,
+                )
+                return
 
-        if not store.promote_user(user.id):
-            await interaction.response.send_message(
-                f"{user.mention} is already an admin.",
+            await interaction.followup.send(
+                f"Promoted {user.mention} to **admin**.",
                 ephemeral=True,
             )
-            return
-
-        await interaction.response.send_message(
-            f"Promoted {user.mention} to **admin**.",
-            ephemeral=True,
-        )
 
     # ------------------------------------------------------------------
     # /voice-demote — demote an admin to user
@@ -245,36 +331,35 @@ class AdminCommands(commands.Cog):
         description="Demote an admin to regular user role",
     )
     @app_commands.describe(user="Admin to demote")
+    @admin_only()
     async def voice_demote(
         self,
         interaction: discord.Interaction,
         user: discord.User,
     ) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
+        await interaction.response.defer(ephemeral=True)
         store = self.bot.auth_store
+        async with self._admin_slot():
+            # Lockout protection
+            if store.is_last_admin(user.id):
+                await interaction.followup.send(
+                    f"Cannot demote {user.mention} — they are the last admin. "
+                    "Promote another user first.",
+                    ephemeral=True,
+                )
+                return
 
-        # Lockout protection
-        if store.is_last_admin(user.id):
-            await interaction.response.send_message(
-                f"Cannot demote {user.mention} — they are the last admin. "
-                "Promote another user first.",
-                ephemeral=True,
-            )
-            return
+            if not store.demote_user(user.id):
+                await interaction.followup.send(
+                    f"{user.mention} is not an admin (or not authorized).",
+                    ephemeral=True,
+                )
+                return
 
-        if not store.demote_user(user.id):
-            await interaction.response.send_message(
-                f"{user.mention} is not an admin (or not authorized).",
+            await interaction.followup.send(
+                f"Demoted {user.mention} to **user**.",
                 ephemeral=True,
             )
-            return
-
-        await interaction.response.send_message(
-            f"Demoted {user.mention} to **user**.",
-            ephemeral=True,
-        )
 
     # ------------------------------------------------------------------
     # /voice-agent — set or clear a per-user agent ID
@@ -288,36 +373,35 @@ class AdminCommands(commands.Cog):
         user="User to configure",
         agent_id="Agent ID to assign (leave empty to reset to default)",
     )
+    @admin_only()
     async def voice_agent(
         self,
         interaction: discord.Interaction,
         user: discord.User,
         agent_id: str | None = None,
     ) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
+        await interaction.response.defer(ephemeral=True)
         store = self.bot.auth_store
+        async with self._admin_slot():
+            if not store.is_authorized(user.id):
+                await interaction.followup.send(
+                    f"{user.mention} is not authorized. Add them first with `/voice-add`.",
+                    ephemeral=True,
+                )
+                return
 
-        if not store.is_authorized(user.id):
-            await interaction.response.send_message(
-                f"{user.mention} is not authorized. Add them first with `/voice-add`.",
-                ephemeral=True,
-            )
-            return
-
-        if agent_id:
-            store.set_agent_id(user.id, agent_id)
-            await interaction.response.send_message(
-                f"Set agent for {user.mention} to `{agent_id}`.",
-                ephemeral=True,
-            )
-        else:
-            store.clear_agent_id(user.id)
-            await interaction.response.send_message(
-                f"Reset agent for {user.mention} to default (`{store.default_agent_id}`).",
-                ephemeral=True,
-            )
+            if agent_id:
+                store.set_agent_id(user.id, agent_id)
+                await interaction.followup.send(
+                    f"Set agent for {user.mention} to `{agent_id}`.",
+                    ephemeral=True,
+                )
+            else:
+                store.clear_agent_id(user.id)
+                await interaction.followup.send(
+                    f"Reset agent for {user.mention} to default (`{store.default_agent_id}`).",
+                    ephemeral=True,
+                )
 
     # ------------------------------------------------------------------
     # /voice-set-user — admin sets voice for another user
@@ -332,49 +416,48 @@ class AdminCommands(commands.Cog):
         voice="Voice to assign (type to search, or paste a custom voice ID/model name). "
               "Leave empty to clear.",
     )
+    @admin_only()
     async def voice_set_user(
         self,
         interaction: discord.Interaction,
         user: discord.User,
         voice: str | None = None,
     ) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
+        await interaction.response.defer(ephemeral=True)
         store = self.bot.auth_store
-
-        if not store.is_authorized(user.id):
-            await interaction.response.send_message(
-                f"{user.mention} is not authorized. Add them first with `/voice-add`.",
-                ephemeral=True,
-            )
-            return
-
-        if not voice:
-            if store.clear_user_voice(user.id):
-                await interaction.response.send_message(
-                    f"Cleared voice override for {user.mention}. Using default voice.",
+        async with self._admin_slot():
+            if not store.is_authorized(user.id):
+                await interaction.followup.send(
+                    f"{user.mention} is not authorized. Add them first with `/voice-add`.",
                     ephemeral=True,
                 )
+                return
+
+            if not voice:
+                if store.clear_user_voice(user.id):
+                    await interaction.followup.send(
+                        f"Cleared voice override for {user.mention}. Using default voice.",
+                        ephemeral=True,
+                    )
+                else:
+                    await interaction.followup.send(
+                        f"{user.mention} has no custom voice set.",
+                        ephemeral=True,
+                    )
+                return
+
+            provider = store.get_effective_tts_provider(self.bot.config.tts.provider)
+            display = _voice_display_name(provider, voice)
+
+            if provider == "elevenlabs":
+                store.set_user_voice(user.id, elevenlabs_voice_id=voice)
             else:
-                await interaction.response.send_message(
-                    f"{user.mention} has no custom voice set.",
-                    ephemeral=True,
-                )
-            return
-
-        provider = store.get_effective_tts_provider(self.bot.config.tts.provider)
-        display = _voice_display_name(provider, voice)
-
-        if provider == "elevenlabs":
-            store.set_user_voice(user.id, elevenlabs_voice_id=voice)
-        else:
-            store.set_user_voice(user.id, local_tts_model=voice)
+                store.set_user_voice(user.id, local_tts_model=voice)
 
-        await interaction.response.send_message(
-            f"Voice for {user.mention} set to **{display}** (provider: {provider}).",
-            ephemeral=True,
-        )
+            await interaction.followup.send(
+                f"Voice for {user.mention} set to **{display}** (provider: {provider}).",
+                ephemeral=True,
+            )
 
     @voice_set_user.autocomplete("voice")
     async def _voice_set_user_autocomplete(
@@ -382,17 +465,7 @@ class AdminCommands(commands.Cog):
     ) -> list[app_commands.Choice[str]]:
         store = self.bot.auth_store
         provider = store.get_effective_tts_provider(self.bot.config.tts.provider)
-        voices = _get_voice_list_for_provider(provider)
-
-        choices: list[app_commands.Choice[str]] = []
-        query = current.lower()
-        for name, value in voices:
-            if query and query not in name.lower() and query not in value.lower():
-                continue
-            choices.append(app_commands.Choice(name=name, value=value))
-            if len(choices) >= 25:
-                break
-        return choices
+        return _match_voices(provider, current, 25)
 
     # ------------------------------------------------------------------
     # /voice-channels — list allowed channels for this guild
@@ -402,40 +475,40 @@ class AdminCommands(commands.Cog):
         name="voice-channels",
         description="List voice channels the bot is allowed to join in this server",
     )
+    @admin_only()
     async def voice_channels(self, interaction: discord.Interaction) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
-        store = self.bot.auth_store
-        guild = interaction.guild
-        allowed = store.get_allowed_channels(guild.id)
-
-        if not allowed:
-            await interaction.response.send_message(
-                "No channel restrictions — the bot can join **any** voice channel in this server.\n"
-                "Use `/voice-channel-add` to restrict it to specific channels.",
-                ephemeral=True,
+        await interaction.response.defer(ephemeral=True)
+        async with self._admin_slot():
+            store = self.bot.auth_store
+            guild = interaction.guild
+            allowed = store.get_allowed_channels(guild.id)
+
+            if not allowed:
+                await interaction.followup.send(
+                    "No channel restrictions — the bot can join **any** voice channel in this server.\n"
+                    "Use `/voice-channel-add` to restrict it to specific channels.",
+                    ephemeral=True,
+                )
+                return
+
+            # <#id> is exactly what Channel.mention renders
+            get_channel = guild.get_channel
+            lines = [
+                f"- <#{cid}> (`{cid}`)" if get_channel(cid) is not None
+                else f"- *Unknown channel* (`{cid}`)"
+                for cid in allowed
+            ]
+
+            embed = discord.Embed(
+                title="Allowed Voice Channels",
+                description="\n".join(lines),
+                color=discord.Color.blue(),
             )
-            return
-
-        lines = []
-        for cid in allowed:
-            channel = guild.get_channel(cid)
-            if channel:
-                lines.append(f"- {channel.mention} (`{cid}`)")
-            else:
-                lines.append(f"- *Unknown channel* (`{cid}`)")
-
-        embed = discord.Embed(
-            title="Allowed Voice Channels",
-            description="\n".join(lines),
-            color=discord.Color.blue(),
-        )
-        embed.set_footer(
-            text="The bot will only auto-join and accept /join for these channels. "
-            "Use /voice-channel-clear to remove all restrictions."
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+            embed.set_footer(
+                text="The bot will only auto-join and accept /join for these channels. "
+                "Use /voice-channel-clear to remove all restrictions."
+            )
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
     # ------------------------------------------------------------------
     # /voice-channel-add — add a channel to the allowlist
@@ -446,29 +519,28 @@ class AdminCommands(commands.Cog):
         description="Add a voice channel the bot is allowed to join",
     )
     @app_commands.describe(channel="Voice channel to allow")
+    @admin_only()
     async def voice_channel_add(
         self,
         interaction: discord.Interaction,
         channel: discord.VoiceChannel,
     ) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
+        await interaction.response.defer(ephemeral=True)
         store = self.bot.auth_store
+        async with self._admin_slot():
+            count = store.add_allowed_channel(interaction.guild.id, channel.id)
+            if count is None:
+                await interaction.followup.send(
+                    f"{channel.mention} is already in the allowlist.",
+                    ephemeral=True,
+                )
+                return
 
-        if not store.add_allowed_channel(interaction.guild.id, channel.id):
-            await interaction.response.send_message(
-                f"{channel.mention} is already in the allowlist.",
+            await interaction.followup.send(
+                f"Added {channel.mention} to the allowlist ({count} channel(s) configured).\n"
+                "The bot will now **only** join allowed channels.",
                 ephemeral=True,
             )
-            return
-
-        count = len(store.get_allowed_channels(interaction.guild.id))
-        await interaction.response.send_message(
-            f"Added {channel.mention} to the allowlist ({count} channel(s) configured).\n"
-            "The bot will now **only** join allowed channels.",
-            ephemeral=True,
-        )
 
     # ------------------------------------------------------------------
     # /voice-channel-remove — remove a channel from the allowlist
@@ -479,34 +551,33 @@ class AdminCommands(commands.Cog):
         description="Remove a voice channel from the bot's allowlist",
     )
     @app_commands.describe(channel="Voice channel to remove")
+    @admin_only()
     async def voice_channel_remove(
         self,
         interaction: discord.Interaction,
         channel: discord.VoiceChannel,
     ) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
+        await interaction.response.defer(ephemeral=True)
         store = self.bot.auth_store
+        async with self._admin_slot():
+            remaining = store.remove_allowed_channel(interaction.guild.id, channel.id)
+            if remaining is None:
+                await interaction.followup.send(
+                    f"{channel.mention} is not in the allowlist.",
+                    ephemeral=True,
+                )
+                return
 
-        if not store.remove_allowed_channel(interaction.guild.id, channel.id):
-            await interaction.response.send_message(
-                f"{channel.mention} is not in the allowlist.",
-                ephemeral=True,
-            )
-            return
-
-        remaining = store.get_allowed_channels(interaction.guild.id)
-        if remaining:
-            await interaction.response.send_message(
-                f"Removed {channel.mention} from the allowlist ({len(remaining)} channel(s) remaining).",
-                ephemeral=True,
-            )
-        else:
-            await interaction.response.send_message(
-                f"Removed {channel.mention}. Allowlist is now empty — bot can join **any** channel.",
-                ephemeral=True,
-            )
+            if remaining:
+                await interaction.followup.send(
+                    f"Removed {channel.mention} from the allowlist ({remaining} channel(s) remaining).",
+                    ephemeral=True,
+                )
+            else:
+                await interaction.followup.send(
+                    f"Removed {channel.mention}. Allowlist is now empty — bot can join **any** channel.",
+                    ephemeral=True,
+                )
 
     # ------------------------------------------------------------------
     # /voice-channel-clear — remove all channel restrictions
@@ -516,20 +587,19 @@ class AdminCommands(commands.Cog):
         name="voice-channel-clear",
         description="Remove all channel restrictions (bot can join any voice channel)",
     )
+    @admin_only()
     async def voice_channel_clear(self, interaction: discord.Interaction) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
+        await interaction.response.defer(ephemeral=True)
         store = self.bot.auth_store
+        async with self._admin_slot():
+            if store.clear_allowed_channels(interaction.guild.id) is None:
+                await interaction.followup.send(
+                    "No channel restrictions to clear — bot can already join any channel.",
+                    ephemeral=True,
+                )
+                return
 
-        if not store.clear_allowed_channels(interaction.guild.id):
-            await interaction.response.send_message(
-                "No channel restrictions to clear — bot can already join any channel.",
+            await interaction.followup.send(
+                "Channel restrictions cleared. The bot can now join **any** voice channel.",
                 ephemeral=True,
             )
-            return
-
-        await interaction.response.send_message(
-            "Channel restrictions cleared. The bot can now join **any** voice channel.",
-            ephemeral=True,
-        )
@@ -0,0 +1,89 @@
+"""Shared app-command checks."""
+
+from __future__ import annotations
+
+import logging
+
+import discord
+from discord import app_commands
+
+log = logging.getLogger(__name__)
+
+
+class CheckRejected(app_commands.CheckFailure):
+    """A check failed; the message is shown to the invoking user."""
+
+
+class NotVoiceAdmin(CheckRejected):
+    """Raised when a non-admin invokes an admin-only command."""
+
+
+class NotAuthorized(CheckRejected):
+    """Raised when a user not in the auth store invokes a voice command."""
+
+
+def admin_only():
+    """Restrict a slash command to bot owners and auth-store admins."""
+
+    async def predicate(interaction: discord.Interaction) -> bool:
+        bot = interaction.client
+        uid = interaction.user.id
+        # Owner IDs are prefetched at startup, so this rarely needs to await
+        if bot.is_voice_admin_cached(uid) or await bot.is_voice_admin(uid):
+            return True
+        raise NotVoiceAdmin("You need admin privileges to use this command.")
+
+    return app_commands.check(predicate)
+
+
+def authorized_only():
+    """Restrict a slash command to users in the auth store."""
+
+    def predicate(interaction: discord.Interaction) -> bool:
+        if interaction.client.auth_store.is_authorized(interaction.user.id):
+            return True
+        raise NotAuthorized(
+            "You're not authorized to use the voice assistant. "
+            "Ask an admin to add you with `/voice-add`."
+        )
+
+    return app_commands.check(predicate)
+
+
+def in_voice_channel():
+    """Require the invoking member to be in a voice channel."""
+
+    def predicate(interaction: discord.Interaction) -> bool:
+        voice = getattr(interaction.user, "voice", None)
+        if voice and voice.channel:
+            return True
+        raise CheckRejected("You need to be in a voice channel first!")
+
+    return app_commands.check(predicate)
+
+
+def bridge_connected():
+    """Require the Node voice bridge to be connected."""
+
+    def predicate(interaction: discord.Interaction) -> bool:
+        if interaction.client.bridge.is_connected:
+            return True
+        raise CheckRejected(
+            "Voice bridge is not connected. Voice features are temporarily unavailable."
+        )
+
+    return app_commands.check(predicate)
+
+
+async def handle_command_error(
+    interaction: discord.Interaction, error: app_commands.AppCommandError
+) -> None:
+    """Reply to check rejections; log anything else."""
+    if isinstance(error, CheckRejected):
+        if not interaction.response.is_done():
+            await interaction.response.send_message(str(error), ephemeral=True)
+        return
+    command = interaction.command
+    log.error(
+        "Error in command %r", command.name if command else None, exc_info=error
+    )
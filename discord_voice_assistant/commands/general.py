@@ -20,78 +20,13 @@ class GeneralCommands(commands.Cog):
 
     def __init__(self, bot: VoiceAssistantBot) -> None:
         self.bot = bot
+        # Help text and these status fields only depend on startup config
+        self._help_embed = self._build_help_embed()
+        config = bot.config
+        self._auto_join_text = "Enabled" if config.voice.auto_join else "Disabled"
+        self._wake_word_text = "Enabled" if config.wake_word.enabled else "Disabled"
 
-    @app_commands.command(name="ping", description="Check if the voice assistant is alive")
-    async def ping(self, interaction: discord.Interaction) -> None:
-        latency = round(self.bot.latency * 1000)
-        await interaction.response.send_message(f"Pong! Latency: {latency}ms", ephemeral=True)
-
-    @app_commands.command(name="status", description="Show the voice assistant's current status")
-    async def status(self, interaction: discord.Interaction) -> None:
-        vm = self.bot.voice_manager
-        bridge = self.bot.bridge
-        session_count = vm.session_count
-        store = self.bot.auth_store
-        authorized = store.user_count
-        admins = store.admin_count
-        name = self.bot.config.discord.bot_name
-
-        effective_provider = store.get_effective_tts_provider(
-            self.bot.config.tts.provider
-        )
-
-        embed = discord.Embed(
-            title=f"{name} Status",
-            color=discord.Color.green() if session_count > 0 else discord.Color.greyple(),
-        )
-        embed.add_field(name="Active Voice Sessions", value=str(session_count), inline=True)
-        embed.add_field(
-            name="Voice Bridge",
-            value="Connected" if bridge.is_connected else "Disconnected",
-            inline=True,
-        )
-        embed.add_field(
-            name="Auto-Join", value="Enabled" if self.bot.config.voice.auto_join else "Disabled", inline=True
-        )
-        embed.add_field(
-            name="Inactivity Timeout",
-            value=f"{self.bot.config.voice.inactivity_timeout}s",
-            inline=True,
-        )
-        embed.add_field(
-            name="Wake Word",
-            value="Enabled" if self.bot.config.wake_word.enabled else "Disabled",
-            inline=True,
-        )
-        embed.add_field(
-            name="TTS Provider", value=effective_provider, inline=True
-        )
-        embed.add_field(
-            name="STT Model", value=self.bot.config.stt.model_size, inline=True
-        )
-        embed.add_field(
-            name="Authorized Users",
-            value=f"{authorized} ({admins} admin)" if authorized else "None (fail-closed)",
-            inline=True,
-        )
-
-        # Show current voice sessions
-        active = vm.active_sessions
-        if active:
-            session_info = []
-            for gid, session in active.items():
-                ch_name = session.channel.name if session.channel else "Unknown"
-                session_info.append(f"#{ch_name}")
-            embed.add_field(
-                name="Connected Channels",
-                value=", ".join(session_info),
-                inline=False,
-            )
-
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-
-    @app_commands.command(name="help", description="Show available voice assistant commands")
-    async def help_cmd(self, interaction: discord.Interaction) -> None:
+    def _build_help_embed(self) -> discord.Embed:
         name = self.bot.config.discord.bot_name
         embed = discord.Embed(
             title=f"{name} - Voice Assistant Commands",
@@ -148,4 +83,69 @@ class GeneralCommands(commands.Cog):
             inline=False,
         )
         embed.set_footer(text=f"Say '{name}' to activate in multi-user voice channels")
+        return embed
+
+    @app_commands.command(name="ping", description="Check if the voice assistant is alive")
+    async def ping(self, interaction: discord.Interaction) -> None:
+        latency = round(self.bot.latency * 1000)
+        await interaction.response.send_message(f"Pong! Latency: {latency}ms", ephemeral=True)
+
+    @app_commands.command(name="status", description="Show the voice assistant's current status")
+    async def status(self, interaction: discord.Interaction) -> None:
+        vm = self.bot.voice_manager
+        bridge = self.bot.bridge
+        session_count = vm.session_count
+        store = self.bot.auth_store
+        authorized = store.user_count
+        admins = store.admin_count
+        name = self.bot.config.discord.bot_name
+
+        effective_provider = store.get_effective_tts_provider(
+            self.bot.config.tts.provider
+        )
+
+        fields = [
+            {"name": "Active Voice Sessions", "value": str(session_count), "inline": True},
+            {
+                "name": "Voice Bridge",
+                "value": "Connected" if bridge.is_connected else "Disconnected",
+                "inline": True,
+            },
+            {"name": "Auto-Join", "value": self._auto_join_text, "inline": True},
+            {
+                "name": "Inactivity Timeout",
+                "value": f"{self.bot.runtime.inactivity_timeout}s",
+                "inline": True,
+            },
+            {"name": "Wake Word", "value": self._wake_word_text, "inline": True},
+            {"name": "TTS Provider", "value": effective_provider, "inline": True},
+            {"name": "STT Model", "value": self.bot.config.stt.model_size, "inline": True},
+            {
+                "name": "Authorized Users",
+                "value": f"{authorized} ({admins} admin)" if authorized else "None (fail-closed)",
+                "inline": True,
+            },
+        ]
+
+        # Show current voice sessions
+        active = vm.snapshot_sessions()
+        if active:
+            fields.append({
+                "name": "Connected Channels",
+                "value": "#" + ", #".join(ch_name for _, ch_name in active),
+                "inline": False,
+            })
+
+        # One from_dict call instead of a setter round-trip per field
+        color = discord.Color.green() if session_count > 0 else discord.Color.greyple()
+        embed = discord.Embed.from_dict({
+            "title": f"{name} Status",
+            "color": color.value,
+            "fields": fields,
+        })
+
         await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="help", description="Show available voice assistant commands")
+    async def help_cmd(self, interaction: discord.Interaction) -> None:
+        await interaction.response.send_message(embed=self._help_embed, ephemeral=True)
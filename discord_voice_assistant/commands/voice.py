@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Literal
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from discord_voice_assistant.commands.checks import (
+    authorized_only,
+    bridge_connected,
+    handle_command_error,
+    in_voice_channel,
+)
+
 if TYPE_CHECKING:
     from discord_voice_assistant.bot import VoiceAssistantBot
 
@@ -21,30 +29,19 @@ class VoiceCommands(commands.Cog):
     def __init__(self, bot: VoiceAssistantBot) -> None:
         self.bot = bot
 
+    async def cog_app_command_error(
+        self, interaction: discord.Interaction, error: app_commands.AppCommandError
+    ) -> None:
+        await handle_command_error(interaction, error)
+
+    # Checks run bottom-up, so the cheapest rejections are listed last
+
     @app_commands.command(name="join", description="Summon the voice assistant to your channel")
+    @bridge_connected()
+    @authorized_only()
+    @in_voice_channel()
     async def join(self, interaction: discord.Interaction) -> None:
-        if not interaction.user.voice or not interaction.user.voice.channel:
-            await interaction.response.send_message(
-                "You need to be in a voice channel first!", ephemeral=True
-            )
-            return
-
         vm = self.bot.voice_manager
-        if not vm.is_authorized(interaction.user.id):
-            await interaction.response.send_message(
-                "You're not authorized to summon the voice assistant. "
-                "Ask the bot owner to use `/authorize` for you.",
-                ephemeral=True,
-            )
-            return
-
-        if not self.bot.bridge.is_connected:
-            await interaction.response.send_message(
-                "Voice bridge is not connected. Voice features are temporarily unavailable.",
-                ephemeral=True,
-            )
-            return
-
         channel = interaction.user.voice.channel
 
         if not vm.is_channel_allowed(interaction.guild.id, channel.id):
@@ -55,12 +52,14 @@ class VoiceCommands(commands.Cog):
             )
             return
 
-        await interaction.response.send_message(f"Joining **{channel.name}**...", ephemeral=True)
-
+        # Acknowledge within Discord's 3s window; the join can take longer
+        await interaction.response.defer(ephemeral=True)
         try:
             await vm.join_channel(channel)
         except Exception as e:
-            await interaction.edit_original_response(content=f"Failed to join: {e}")
+            await interaction.followup.send(f"Failed to join: {e}", ephemeral=True)
+        else:
+            await interaction.followup.send(f"Joined **{channel.name}**.", ephemeral=True)
 
     @app_commands.command(name="leave", description="Make the voice assistant leave the channel")
     async def leave(self, interaction: discord.Interaction) -> None:
@@ -78,21 +77,19 @@ class VoiceCommands(commands.Cog):
         name="rejoin",
         description="Rejoin the voice channel after inactivity disconnect",
     )
+    @bridge_connected()
+    @authorized_only()
+    @in_voice_channel()
     async def rejoin(self, interaction: discord.Interaction) -> None:
-        if not interaction.user.voice or not interaction.user.voice.channel:
-            await interaction.response.send_message(
-                "You need to be in a voice channel first!", ephemeral=True
-            )
-            return
-
         vm = self.bot.voice_manager
-        if not vm.is_authorized(interaction.user.id):
-            await interaction.response.send_message("You're not authorized.", ephemeral=True)
-            return
-
         channel = interaction.user.voice.channel
-        await interaction.response.send_message(f"Rejoining **{channel.name}**...", ephemeral=True)
-        await vm.join_channel(channel)
+        await interaction.response.defer(ephemeral=True)
+        try:
+            await vm.join_channel(channel)
+        except Exception as e:
+            await interaction.followup.send(f"Failed to rejoin: {e}", ephemeral=True)
+        else:
+            await interaction.followup.send(f"Rejoined **{channel.name}**.", ephemeral=True)
 
     @app_commands.command(
         name="voice-status",
@@ -108,13 +105,12 @@ class VoiceCommands(commands.Cog):
             )
             return
 
-        import time
-
         duration = time.monotonic() - session.start_time
-        minutes, seconds = divmod(int(duration), 60)
-        hours, minutes = divmod(minutes, 60)
+        hours, rem = divmod(int(duration), 3600)
+        minutes, seconds = divmod(rem, 60)
 
         bridge = self.bot.bridge
+        channel = session.channel
         guild_id_str = str(interaction.guild.id)
 
         embed = discord.Embed(
@@ -122,7 +118,7 @@ class VoiceCommands(commands.Cog):
             color=discord.Color.green(),
         )
         embed.add_field(
-            name="Channel", value=session.channel.name, inline=True
+            name="Channel", value=channel.name, inline=True
         )
         embed.add_field(
             name="Duration", value=f"{hours}h {minutes}m {seconds}s", inline=True
@@ -143,10 +139,11 @@ class VoiceCommands(commands.Cog):
             inline=True,
         )
 
-        members = [m for m in session.channel.members if not m.bot]
         embed.add_field(
             name="Users in Channel",
-            value=", ".join(m.display_name for m in members) or "None",
+            value=", ".join(
+                m.display_name for m in channel.members if not m.bot
+            ) or "None",
             inline=False,
         )
 
@@ -157,19 +154,15 @@ class VoiceCommands(commands.Cog):
         description="Set the inactivity timeout (in seconds)",
     )
     @app_commands.describe(seconds="Timeout in seconds (0 to disable)")
+    @authorized_only()
     async def timeout(
         self,
         interaction: discord.Interaction,
         seconds: app_commands.Range[int, 0, 3600],
     ) -> None:
         vm = self.bot.voice_manager
-        if not vm.is_authorized(interaction.user.id):
-            await interaction.response.send_message("You're not authorized.", ephemeral=True)
-            return
-
-        # Runtime-only change
-        # We need a mutable config for this; use object.__setattr__ since frozen
-        object.__setattr__(self.bot.config.voice, "inactivity_timeout", seconds)
+        # Runtime-only change; config.voice keeps the startup value
+        self.bot.runtime.inactivity_timeout = seconds
 
         if seconds == 0:
             await interaction.response.send_message(
@@ -185,72 +178,49 @@ class VoiceCommands(commands.Cog):
         if session and session.is_active:
             vm.reset_inactivity(interaction.guild.id)
 
-    @app_commands.command(
-        name="new",
-        description="Start a fresh conversation (clears your context)",
-    )
-    async def new_session(self, interaction: discord.Interaction) -> None:
-        vm = self.bot.voice_manager
-        session = vm.get_session(interaction.guild.id)
-
+    async def _run_user_session_op(
+        self,
+        interaction: discord.Interaction,
+        op: Literal["reset", "compact"],
+        done_msg: str,
+    ) -> None:
+        """Reset or compact the caller's OpenClaw session in this guild."""
+        session = self.bot.voice_manager.get_session(interaction.guild.id)
         if not session or not session.is_active:
             await interaction.response.send_message(
                 "No active voice session in this server.", ephemeral=True
             )
             return
 
-        if not vm.is_authorized(interaction.user.id):
-            await interaction.response.send_message("You're not authorized.", ephemeral=True)
-            return
-
-        # Reset the caller's per-user session
         user_session_id = session._get_or_create_user_session(interaction.user.id)
         user_agent_id = self.bot.auth_store.get_agent_id(interaction.user.id)
 
         await interaction.response.defer(ephemeral=True)
-        success = await session._openclaw.reset_session(
-            user_session_id, agent_id=user_agent_id
-        )
-        if success:
-            await interaction.followup.send(
-                "Your conversation cleared. Starting fresh!", ephemeral=True
-            )
+        openclaw = session._openclaw
+        action = openclaw.reset_session if op == "reset" else openclaw.compact_session
+        if await action(user_session_id, agent_id=user_agent_id):
+            await interaction.followup.send(done_msg, ephemeral=True)
         else:
             await interaction.followup.send(
-                "Failed to reset conversation. Check logs for details.", ephemeral=True
+                f"Failed to {op} conversation. Check logs for details.", ephemeral=True
             )
 
+    @app_commands.command(
+        name="new",
+        description="Start a fresh conversation (clears your context)",
+    )
+    @authorized_only()
+    async def new_session(self, interaction: discord.Interaction) -> None:
+        await self._run_user_session_op(
+            interaction, "reset", "Your conversation cleared. Starting fresh!"
+        )
+
     @app_commands.command(
         name="compact",
         description="Summarize your conversation history to free up context space",
     )
+    @authorized_only()
     async def compact_session(self, interaction: discord.Interaction) -> None:
-        vm = self.bot.voice_manager
-        session = vm.get_session(interaction.guild.id)
-
-        if not session or not session.is_active:
-            await interaction.response.send_message(
-                "No active voice session in this server.", ephemeral=True
-            )
-            return
-
-        if not vm.is_authorized(interaction.user.id):
-            await interaction.response.send_message("You're not authorized.", ephemeral=True)
-            return
-
-        # Compact the caller's per-user session
-        user_session_id = session._get_or_create_user_session(interaction.user.id)
-        user_agent_id = self.bot.auth_store.get_agent_id(interaction.user.id)
-
-        await interaction.response.defer(ephemeral=True)
-        success = await session._openclaw.compact_session(
-            user_session_id, agent_id=user_agent_id
+        await self._run_user_session_op(
+            interaction, "compact", "Your conversation compacted. Context has been summarized."
         )
-        if success:
-            await interaction.followup.send(
-                "Your conversation compacted. Context has been summarized.", ephemeral=True
-            )
-        else:
-            await interaction.followup.send(
-                "Failed to compact conversation. Check logs for details.", ephemeral=True
-            )
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import logging
-import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from discord_voice_assistant.audio.tts import _PIPER_MODEL_DIR
+from discord_voice_assistant.commands.checks import admin_only, handle_command_error
+
 if TYPE_CHECKING:
     from discord_voice_assistant.bot import VoiceAssistantBot
 
@@ -59,6 +63,45 @@ PIPER_VOICES: list[tuple[str, str]] = [
     ("VCTK (GB, medium) - multi-speaker", "en_GB-vctk-medium"),
 ]
 
+# Piper voices grouped by accent for the /voice-voices columns
+PIPER_VOICES_US: list[tuple[str, str]] = [
+    v for v in PIPER_VOICES if not v[1].startswith("en_GB")
+]
+PIPER_VOICES_GB: list[tuple[str, str]] = [
+    v for v in PIPER_VOICES if v[1].startswith("en_GB")
+]
+
+
+# Always offered first by /voice-set autocomplete; Choice is never mutated
+_RESET_CHOICE = app_commands.Choice(name="Reset to default", value="__reset__")
+
+# Reverse lookups: voice value -> display name, per provider
+_DISPLAY_BY_PROVIDER: dict[str, dict[str, str]] = {
+    "elevenlabs": {vid: name for name, vid in ELEVENLABS_VOICES},
+    "local": {model: name for name, model in PIPER_VOICES},
+}
+_KNOWN_PIPER_MODELS = frozenset(_DISPLAY_BY_PROVIDER["local"])
+
+
+# Discord rejects embed field values longer than this
+_EMBED_FIELD_LIMIT = 1024
+
+
+def _field_body(voices: list[tuple[str, str]]) -> str:
+    """Format a voice list as a /voice-voices embed field value."""
+    body = "\n".join(f"**{name}**\n`{value}`" for name, value in voices)
+    if len(body) > _EMBED_FIELD_LIMIT:
+        raise ValueError(
+            f"Voice list field is {len(body)} chars; Discord allows {_EMBED_FIELD_LIMIT}"
+        )
+    return body
+
+
+# /voice-voices field bodies; the curated lists never change at runtime
+_ELEVENLABS_BODY = _field_body(ELEVENLABS_VOICES)
+_PIPER_US_BODY = _field_body(PIPER_VOICES_US)
+_PIPER_GB_BODY = _field_body(PIPER_VOICES_GB)
+
 
 def _get_voice_list_for_provider(provider: str) -> list[tuple[str, str]]:
     """Return (display_name, value) pairs for the given provider."""
@@ -67,24 +110,66 @@ def _get_voice_list_for_provider(provider: str) -> list[tuple[str, str]]:
     return PIPER_VOICES
 
 
+class _VoiceIndex(NamedTuple):
+    """Pre-lowered search index over one provider's voice list."""
+
+    choices: tuple[app_commands.Choice[str], ...]  # catalog order
+    haystacks: tuple[str, ...]  # lowered "name\0value", catalog order
+    sorted_names: tuple[str, ...]  # lowered display names, sorted
+    sorted_pos: tuple[int, ...]  # catalog position of each sorted name
+
+
+@functools.lru_cache(maxsize=None)
+def _get_voice_index(provider: str) -> _VoiceIndex:
+    voices = _get_voice_list_for_provider(provider)
+    lowered = [(name.lower(), value.lower()) for name, value in voices]
+    order = sorted(range(len(voices)), key=lambda i: lowered[i][0])
+    return _VoiceIndex(
+        choices=tuple(app_commands.Choice(name=n, value=v) for n, v in voices),
+        haystacks=tuple(f"{n}\0{v}" for n, v in lowered),
+        sorted_names=tuple(lowered[i][0] for i in order),
+        sorted_pos=tuple(order),
+    )
+
+
+def _match_voices(provider: str, current: str, limit: int) -> list[app_commands.Choice[str]]:
+    """Return up to ``limit`` voice choices matching ``current``.
+
+    Display-name prefix matches come first (found by bisection), followed
+    by any other voices whose name or value contains the query.
+    """
+    index = _get_voice_index(provider)
+    query = current.lower()
+    if not query:
+        return list(index.choices[:limit])
+
+    hits: list[int] = []
+    i = bisect.bisect_left(index.sorted_names, query)
+    while i < len(index.sorted_names) and len(hits) < limit:
+        if not index.sorted_names[i].startswith(query):
+            break
+        hits.append(index.sorted_pos[i])
+        i += 1
+    if len(hits) < limit:
+        seen = set(hits)
+        for pos, hay in enumerate(index.haystacks):
+            if pos not in seen and query in hay:
+                hits.append(pos)
+                if len(hits) >= limit:
+                    break
+    return [index.choices[pos] for pos in hits]
+
+
+@functools.lru_cache(maxsize=None)
+def _voice_set_default_choices(provider: str) -> list[app_commands.Choice[str]]:
+    """/voice-set autocomplete result for an empty query (shared, do not mutate)."""
+    return [_RESET_CHOICE, *_get_voice_index(provider).choices[:24]]
+
+
 def _voice_display_name(provider: str, value: str) -> str:
     """Look up the display name for a voice value, or return the raw value."""
-    for name, vid in _get_voice_list_for_provider(provider):
-        if vid == value:
-            return name
-    return value
-
-
-async def _check_admin(bot: VoiceAssistantBot, interaction: discord.Interaction) -> bool:
-    """Return True if the caller is a bot owner or auth-store admin."""
-    if await bot.is_owner(interaction.user):
-        return True
-    if bot.auth_store.is_admin(interaction.user.id):
-        return True
-    await interaction.response.send_message(
-        "You need admin privileges to use this command.", ephemeral=True
-    )
-    return False
+    names = _DISPLAY_BY_PROVIDER.get(provider, _DISPLAY_BY_PROVIDER["local"])
+    return names.get(value, value)
 
 
 class VoiceConfigCommands(commands.Cog):
@@ -92,6 +177,25 @@ class VoiceConfigCommands(commands.Cog):
 
     def __init__(self, bot: VoiceAssistantBot) -> None:
         self.bot = bot
+        # The env defaults are frozen, so their /voice-config lines are too
+        tts_cfg = bot.config.tts
+        default_voice = _voice_display_name("elevenlabs", tts_cfg.elevenlabs_voice_id)
+        default_model = _voice_display_name("local", tts_cfg.local_model)
+        self._default_voice_text = {
+            "elevenlabs": (
+                f"**Default voice:** {default_voice}\n"
+                f"**Default voice ID:** `{tts_cfg.elevenlabs_voice_id}`"
+            ),
+            "local": (
+                f"**Default model:** {default_model}\n"
+                f"**Default model name:** `{tts_cfg.local_model}`"
+            ),
+        }
+
+    async def cog_app_command_error(
+        self, interaction: discord.Interaction, error: app_commands.AppCommandError
+    ) -> None:
+        await handle_command_error(interaction, error)
 
     # ------------------------------------------------------------------
     # /voice-provider — set global TTS provider (admin only)
@@ -111,14 +215,12 @@ class VoiceConfigCommands(commands.Cog):
             app_commands.Choice(name="reset to env default", value="__reset__"),
         ]
     )
+    @admin_only()
     async def voice_provider(
         self,
         interaction: discord.Interaction,
         provider: app_commands.Choice[str],
     ) -> None:
-        if not await _check_admin(self.bot, interaction):
-            return
-
         store = self.bot.auth_store
 
         if provider.value == "__reset__":
@@ -193,13 +295,12 @@ class VoiceConfigCommands(commands.Cog):
             store.set_user_voice(interaction.user.id, elevenlabs_voice_id=voice)
         else:
             # Validate the Piper model exists or is a known model name
-            known_models = {m for _, m in PIPER_VOICES}
-            piper_model_dir = os.getenv(
-                "PIPER_MODEL_DIR",
-                os.path.join(os.getenv("MODELS_DIR", "models"), "piper"),
-            )
-            model_file = os.path.join(piper_model_dir, f"{voice}.onnx")
-            if voice not in known_models and not os.path.isfile(model_file):
+            # Known names skip the stat; installed models are checked live
+            # since TTS downloads new ones at runtime
+            if (
+                voice not in _KNOWN_PIPER_MODELS
+                and not (_PIPER_MODEL_DIR / f"{voice}.onnx").is_file()
+            ):
                 warning = (
                     f"\n\n**Warning:** Model `{voice}` is not pre-installed "
                     "and not in the known voice list. It will be auto-downloaded "
@@ -221,19 +322,12 @@ class VoiceConfigCommands(commands.Cog):
     ) -> list[app_commands.Choice[str]]:
         store = self.bot.auth_store
         provider = store.get_effective_tts_provider(self.bot.config.tts.provider)
-        voices = _get_voice_list_for_provider(provider)
-
-        # Always include reset option
-        choices = [app_commands.Choice(name="Reset to default", value="__reset__")]
-
-        query = current.lower()
-        for name, value in voices:
-            if query and query not in name.lower() and query not in value.lower():
-                continue
-            choices.append(app_commands.Choice(name=name, value=value))
-            if len(choices) >= 25:  # Discord limit
-                break
+        if not current:
+            return _voice_set_default_choices(provider)
 
+        # Always include reset option; Discord allows 25 choices in total
+        choices = [_RESET_CHOICE]
+        choices.extend(_match_voices(provider, current, 24))
         return choices
 
     # ------------------------------------------------------------------
@@ -264,7 +358,6 @@ class VoiceConfigCommands(commands.Cog):
             if provider
             else store.get_effective_tts_provider(self.bot.config.tts.provider)
         )
-        voices = _get_voice_list_for_provider(effective_provider)
 
         embed = discord.Embed(
             title=f"Available Voices ({effective_provider})",
@@ -276,32 +369,17 @@ class VoiceConfigCommands(commands.Cog):
                 "Built-in ElevenLabs voices. You can also use any custom "
                 "voice ID from your ElevenLabs account."
             )
-            lines = []
-            for name, vid in voices:
-                lines.append(f"**{name}**\n`{vid}`")
-            embed.add_field(name="Voices", value="\n".join(lines), inline=False)
+            embed.add_field(name="Voices", value=_ELEVENLABS_BODY, inline=False)
         else:
             embed.description = (
                 "Piper voices (auto-downloaded from HuggingFace on first use). "
                 "You can also use any valid Piper model name."
             )
             # Split into US and GB columns
-            us_lines = []
-            gb_lines = []
-            for name, model in voices:
-                line = f"**{name}**\n`{model}`"
-                if model.startswith("en_GB"):
-                    gb_lines.append(line)
-                else:
-                    us_lines.append(line)
-            if us_lines:
-                embed.add_field(
-                    name="US English", value="\n".join(us_lines), inline=True
-                )
-            if gb_lines:
-                embed.add_field(
-                    name="GB English", value="\n".join(gb_lines), inline=True
-                )
+            if _PIPER_US_BODY:
+                embed.add_field(name="US English", value=_PIPER_US_BODY, inline=True)
+            if _PIPER_GB_BODY:
+                embed.add_field(name="GB English", value=_PIPER_GB_BODY, inline=True)
 
         embed.set_footer(text="Use /voice-set <voice> to set your voice")
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -316,9 +394,7 @@ class VoiceConfigCommands(commands.Cog):
     )
     async def voice_config(self, interaction: discord.Interaction) -> None:
         store = self.bot.auth_store
-        tts_cfg = self.bot.config.tts
-
-        env_provider = tts_cfg.provider
+        env_provider = self.bot.config.tts.provider
         global_override = store.get_global_tts_provider()
         effective_provider = global_override or env_provider
 
@@ -328,21 +404,15 @@ class VoiceConfigCommands(commands.Cog):
         )
 
         # Global section
-        global_lines = [
-            f"**Env default provider:** `{env_provider}`",
-        ]
+        global_lines = [f"**Env default provider:** `{env_provider}`"]
         if global_override:
             global_lines.append(f"**Global override:** `{global_override}`")
         global_lines.append(f"**Active provider:** `{effective_provider}`")
-
-        if effective_provider == "elevenlabs":
-            default_voice = _voice_display_name("elevenlabs", tts_cfg.elevenlabs_voice_id)
-            global_lines.append(f"**Default voice:** {default_voice}")
-            global_lines.append(f"**Default voice ID:** `{tts_cfg.elevenlabs_voice_id}`")
-        else:
-            default_model = _voice_display_name("local", tts_cfg.local_model)
-            global_lines.append(f"**Default model:** {default_model}")
-            global_lines.append(f"**Default model name:** `{tts_cfg.local_model}`")
+        global_lines.append(
+            self._default_voice_text[
+                "elevenlabs" if effective_provider == "elevenlabs" else "local"
+            ]
+        )
 
         embed.add_field(
             name="Global Settings",
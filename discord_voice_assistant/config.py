@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -21,20 +22,22 @@ def _int_list(val: str | None) -> list[int]:
     return [int(v.strip()) for v in val.split(",") if v.strip()]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscordConfig:
     token: str = os.getenv("DISCORD_BOT_TOKEN", "")
     bot_name: str = os.getenv("BOT_NAME", "OpenClaw")
+    # Sync slash commands on every start, even if the command tree is unchanged
+    force_command_sync: bool = _bool(os.getenv("FORCE_COMMAND_SYNC", "false"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenClawConfig:
     url: str = os.getenv("OPENCLAW_URL", "http://localhost:18789")
     api_key: str = os.getenv("OPENCLAW_API_KEY", "")
     agent_id: str = os.getenv("OPENCLAW_AGENT_ID", "voice")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TTSConfig:
     provider: str = os.getenv("TTS_PROVIDER", "local")
     elevenlabs_api_key: str = os.getenv("ELEVENLABS_API_KEY", "")
@@ -42,9 +45,10 @@ class TTSConfig:
     local_model: str = os.getenv("LOCAL_TTS_MODEL", "en_US-hfc_male-medium")
     sentence_silence_ms: int = int(os.getenv("TTS_SENTENCE_SILENCE_MS", "300"))
     strip_leading_silence: bool = _bool(os.getenv("TTS_STRIP_LEADING_SILENCE", "true"))
+    persistent_piper: bool = _bool(os.getenv("TTS_PIPER_PERSISTENT", "true"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class STTConfig:
     model_size: str = os.getenv("STT_MODEL_SIZE", "base")
     device: str = os.getenv("STT_DEVICE", "auto")
@@ -56,14 +60,14 @@ class STTConfig:
     preload: bool = _bool(os.getenv("STT_PRELOAD", "true"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WakeWordConfig:
     enabled: bool = _bool(os.getenv("WAKE_WORD_ENABLED", "false"))
     model_path: str = os.getenv("WAKE_WORD_MODEL_PATH", "")
     threshold: float = float(os.getenv("WAKE_WORD_THRESHOLD", "0.5"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThinkingSoundConfig:
     tone1_hz: float = float(os.getenv("THINKING_TONE1_HZ", "130"))
     tone2_hz: float = float(os.getenv("THINKING_TONE2_HZ", "130"))
@@ -73,19 +77,19 @@ class ThinkingSoundConfig:
     duration: float = float(os.getenv("THINKING_DURATION", "2.5"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoiceBridgeConfig:
     url: str = os.getenv("VOICE_BRIDGE_URL", "ws://localhost:9876")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoiceConfig:
     auto_join: bool = _bool(os.getenv("AUTO_JOIN_ENABLED", "true"))
     inactivity_timeout: int = int(os.getenv("INACTIVITY_TIMEOUT", "300"))
     max_session_duration: int = int(os.getenv("MAX_SESSION_DURATION", "0"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthConfig:
     authorized_user_ids: list[int] = field(
         default_factory=lambda: _int_list(os.getenv("AUTHORIZED_USER_IDS", ""))
@@ -99,7 +103,7 @@ class AuthConfig:
     default_agent_id: str = os.getenv("DEFAULT_AGENT_ID", "")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebhookConfig:
     enabled: bool = _bool(os.getenv("WEBHOOK_ENABLED", "true"))
     port: int = int(os.getenv("WEBHOOK_PORT", "18790"))
@@ -110,7 +114,19 @@ class WebhookConfig:
     )
 
 
-@dataclass(frozen=True)
+class RuntimeSettings:
+    """Settings that slash commands can change while the bot is running.
+
+    Seeded from the frozen config at startup; changes are not persisted.
+    """
+
+    __slots__ = ("inactivity_timeout",)
+
+    def __init__(self, config: Config) -> None:
+        self.inactivity_timeout: int = config.voice.inactivity_timeout
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     discord: DiscordConfig = field(default_factory=DiscordConfig)
     openclaw: OpenClawConfig = field(default_factory=OpenClawConfig)
@@ -137,3 +153,13 @@ class Config:
         if self.tts.provider == "elevenlabs" and not self.tts.elevenlabs_api_key:
             errors.append("ELEVENLABS_API_KEY is required when TTS_PROVIDER=elevenlabs")
         return errors
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, building it on first use.
+
+    Environment changes after the first call are not picked up; call
+    ``get_config.cache_clear()`` to rebuild.
+    """
+    return Config()
@@ -18,15 +18,44 @@ import asyncio
 import json
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from discord_voice_assistant.config import OpenClawConfig
 
 log = logging.getLogger(__name__)
 
+# Voice instruction is embedded in the user message because OpenClaw's
+# agent has its own system prompt that overrides any system message we send.
+_VOICE_INSTRUCTION = (
+    "(You are responding via voice in a Discord voice channel. "
+    "Your reply will be read aloud by text-to-speech. "
+    "Be concise and conversational — match response length to the question. "
+    "Simple questions get short answers; complex topics can be longer but stay focused. "
+    "Do NOT use markdown, bullet points, numbered lists, code blocks, or emoji. "
+    "Reply in plain, natural speech.) "
+)
+
+
+def _dumps(data: Any) -> str:
+    """Request body serializer for aiohttp (which expects str)."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class OpenClawClient:
     """Client for communicating with an OpenClaw instance.
@@ -39,15 +68,32 @@ class OpenClawClient:
     def __init__(self, config: OpenClawConfig) -> None:
         self.config = config
         self.base_url = config.url.rstrip("/")
+        self._url = f"{self.base_url}/v1/chat/completions"
         self._http: aiohttp.ClientSession | None = None
 
         self._headers: dict[str, str] = {"Content-Type": "application/json"}
         if config.api_key:
             self._headers["Authorization"] = f"Bearer {config.api_key}"
+        # Routing headers for the configured agent; never mutated
+        self._default_agent_headers = self._build_agent_headers(config.agent_id)
+
+    @staticmethod
+    def _build_agent_headers(agent_id: str | None) -> dict[str, str]:
+        if agent_id and agent_id != "default":
+            return {"x-openclaw-agent-id": agent_id}
+        return {}
+
+    def _agent_headers(self, agent_id: str | None) -> dict[str, str]:
+        """Per-request routing headers; reuses the default when not overridden."""
+        if not agent_id or agent_id == self.config.agent_id:
+            return self._default_agent_headers
+        return self._build_agent_headers(agent_id)
 
     async def _get_http(self) -> aiohttp.ClientSession:
         if self._http is None or self._http.closed:
-            self._http = aiohttp.ClientSession(headers=self._headers)
+            self._http = aiohttp.ClientSession(
+                headers=self._headers, json_serialize=_dumps
+            )
         return self._http
 
     async def create_session(self, context: str = "") -> str:
@@ -78,13 +124,9 @@ class OpenClawClient:
                 "user": session_id,
             }
 
-            effective_agent = agent_id or self.config.agent_id
-            headers = {}
-            if effective_agent and effective_agent != "default":
-                headers["x-openclaw-agent-id"] = effective_agent
+            headers = self._agent_headers(agent_id)
 
-            url = f"{self.base_url}/v1/chat/completions"
-            async with http.post(url, json=payload, headers=headers) as resp:
+            async with http.post(self._url, json=payload, headers=headers) as resp:
                 if resp.status == 200:
                     log.info(
                         "Command '%s' successful (session: %s)", command, session_id,
@@ -154,44 +196,33 @@ class OpenClawClient:
             # Prefix the message with the speaker's name for multi-user context
             content = f"[{sender_name}]: {text}" if sender_name else text
 
-            # Voice instruction is embedded in the user message because OpenClaw's
-            # agent has its own system prompt that overrides any system message we send.
-            voice_instruction = (
-                "(You are responding via voice in a Discord voice channel. "
-                "Your reply will be read aloud by text-to-speech. "
-                "Be concise and conversational — match response length to the question. "
-                "Simple questions get short answers; complex topics can be longer but stay focused. "
-                "Do NOT use markdown, bullet points, numbered lists, code blocks, or emoji. "
-                "Reply in plain, natural speech.) "
-            )
-
             payload = {
                 "model": "openclaw",
                 "messages": [
-                    {"role": "user", "content": voice_instruction + content},
+                    {"role": "user", "content": _VOICE_INSTRUCTION + content},
                 ],
                 "user": session_id,
             }
 
-            effective_agent = agent_id or self.config.agent_id
-            headers = {}
-            if effective_agent and effective_agent != "default":
-                headers["x-openclaw-agent-id"] = effective_agent
+            headers = self._agent_headers(agent_id)
 
-            url = f"{self.base_url}/v1/chat/completions"
             log.debug(
                 "OpenClaw request: POST %s agent=%s session=%s msg=%r",
-                url, self.config.agent_id, session_id, content[:300],
+                self._url, self.config.agent_id, session_id, content[:300],
             )
 
             t0 = time.monotonic()
-            async with http.post(url, json=payload, headers=headers) as resp:
+            async with http.post(self._url, json=payload, headers=headers) as resp:
                 elapsed = time.monotonic() - t0
                 log.debug(
                     "OpenClaw response: status=%d, %.3fs", resp.status, elapsed,
                 )
                 if resp.status == 200:
-                    data = await resp.json()
+                    try:
+                        data = _loads(await resp.read())
+                    except ValueError as e:
+                        log.error("OpenClaw returned invalid JSON: %s", e)
+                        return ""
                     # OpenAI format: choices[0].message.content
                     choices = data.get("choices", [])
                     if choices:
@@ -249,44 +280,29 @@ class OpenClawClient:
 
             content = f"[{sender_name}]: {text}" if sender_name else text
 
-            voice_instruction = (
-                "(You are responding via voice in a Discord voice channel. "
-                "Your reply will be read aloud by text-to-speech. "
-                "Be concise and conversational — match response length to the question. "
-                "Simple questions get short answers; complex topics can be longer but stay focused. "
-                "Do NOT use markdown, bullet points, numbered lists, code blocks, or emoji. "
-                "Reply in plain, natural speech.) "
-            )
-
             payload = {
                 "model": "openclaw",
                 "messages": [
-                    {"role": "user", "content": voice_instruction + content},
+                    {"role": "user", "content": _VOICE_INSTRUCTION + content},
                 ],
                 "user": session_id,
                 "stream": True,
             }
 
-            effective_agent = agent_id or self.config.agent_id
-            headers = {}
-            if effective_agent and effective_agent != "default":
-                headers["x-openclaw-agent-id"] = effective_agent
+            headers = self._agent_headers(agent_id)
 
-            async with http.post(
-                f"{self.base_url}/v1/chat/completions",
-                json=payload,
-                headers=headers,
-            ) as resp:
+            async with http.post(self._url, json=payload, headers=headers) as resp:
                 if resp.status == 200:
+                    # SSE lines are parsed as bytes; both JSON backends accept them
                     async for line in resp.content:
-                        line = line.decode("utf-8").strip()
-                        if not line or not line.startswith("data: "):
+                        line = line.strip()
+                        if not line.startswith(b"data: "):
                             continue
                         data_str = line[6:]
-                        if data_str == "[DONE]":
+                        if data_str == b"[DONE]":
                             break
                         try:
-                            data = json.loads(data_str)
+                            data = _loads(data_str)
                             delta = (
                                 data.get("choices", [{}])[0]
                                 .get("delta", {})
@@ -294,7 +310,7 @@ class OpenClawClient:
                             )
                             if delta:
                                 yield delta
-                        except (json.JSONDecodeError, IndexError):
+                        except (ValueError, IndexError):
                             continue
                 else:
                     text_resp = await resp.text()
@@ -44,6 +44,8 @@ class VoiceBridgeClient:
         self.url = url
         self._ws: ClientConnection | None = None
         self._connected = asyncio.Event()
+        # Called synchronously with the new state on connect/disconnect
+        self._state_callbacks: list[Callable[[bool], None]] = []
         self._task: asyncio.Task | None = None
         self._reconnect_attempts = 0
         # guild_id -> callback for incoming audio
@@ -77,9 +79,23 @@ class VoiceBridgeClient:
         if self._ws:
             await self._ws.close()
             self._ws = None
+        # Deliberate shutdown: clear without notifying state callbacks
         self._connected.clear()
 
-    async def wait_connected(self, timeout: float = 10.0) -> None:
+    def _set_connected(self, connected: bool) -> None:
+        if connected == self._connected.is_set():
+            return
+        if connected:
+            self._connected.set()
+        else:
+            self._connected.clear()
+        for cb in list(self._state_callbacks):
+            try:
+                cb(connected)
+            except Exception:
+                log.exception("Bridge state callback failed")
+
+    async def wait_connected(self, timeout: float | None = 10.0) -> None:
         """Wait for the bridge WebSocket to be connected."""
         await asyncio.wait_for(self._connected.wait(), timeout=timeout)
 
@@ -99,7 +115,7 @@ class VoiceBridgeClient:
                     self.url, max_size=self._WS_MAX_SIZE,
                 ) as ws:
                     self._ws = ws
-                    self._connected.set()
+                    self._set_connected(True)
                     is_reconnect = self._reconnect_attempts > 0
                     if is_reconnect:
                         log.info(
@@ -128,10 +144,13 @@ class VoiceBridgeClient:
                             await self._handle_message(msg)
                         except json.JSONDecodeError:
                             log.warning("Invalid JSON from bridge: %s", raw[:200])
+                # Bridge closed the socket cleanly; reconnect straight away
+                self._ws = None
+                self._set_connected(False)
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
-                self._connected.clear()
+                self._set_connected(False)
                 self._ws = None
                 # Unblock any pending play() waiters so the pipeline doesn't
                 # hang for the full 120 s timeout.
@@ -240,6 +259,10 @@ class VoiceBridgeClient:
         """Remove the speaking callback for a guild."""
         self._speaking_callbacks.pop(guild_id, None)
 
+    def register_state_callback(self, callback: Callable[[bool], None]) -> None:
+        """Register a callback invoked with True/False on connect/disconnect."""
+        self._state_callbacks.append(callback)
+
     def register_reconnect_callback(
         self, guild_id: str, callback: Callable[[], Awaitable[None]],
     ) -> None:
@@ -10,11 +10,11 @@ import aiohttp
 import discord
 
 from discord_voice_assistant.audio.stt import SpeechToText
-from discord_voice_assistant.audio.tts import TextToSpeech
+from discord_voice_assistant.audio.tts import PiperWorkerPool, TextToSpeech
 from discord_voice_assistant.audio.voicemail import (
-    calculate_waveform,
+    analyze_wav,
     create_dm_channel,
-    get_wav_duration,
+    create_http_session,
     send_voice_message,
     wav_to_ogg_opus,
 )
@@ -42,6 +42,8 @@ class VoiceManager:
         self._guild_locks: dict[int, asyncio.Lock] = {}
         # Shared STT instance that persists across sessions (when STT_PRELOAD=true)
         self._shared_stt: SpeechToText | None = None
+        # Persistent Piper workers shared by every session's TTS and voicemail
+        self._piper_pool = PiperWorkerPool()
         # Pending notify messages: user_id -> [(text, priority)]
         self._pending_notify: dict[int, list[tuple[str, int]]] = {}
         # Shared TTS instance for voicemail (no active session needed)
@@ -81,7 +83,11 @@ class VoiceManager:
         before: discord.VoiceState,
         after: discord.VoiceState,
     ) -> None:
-        """React to users joining/leaving voice channels."""
+        """React to users joining/leaving voice channels.
+
+        Only channel changes matter here; the bot skips calling this for
+        updates where ``before.channel == after.channel``.
+        """
         guild_id = member.guild.id
 
         # User joined a voice channel
@@ -170,6 +176,7 @@ class VoiceManager:
             session = VoiceSession(
                 self.bot, self.config, channel, self.bridge,
                 shared_stt=self._shared_stt,
+                piper_pool=self._piper_pool,
             )
             self._sessions[guild_id] = session
             try:
@@ -235,7 +242,7 @@ class VoiceManager:
         self._cancel_inactivity_timer(guild_id)
 
         if timeout is None:
-            timeout = self.config.voice.inactivity_timeout
+            timeout = self.bot.runtime.inactivity_timeout
         if timeout <= 0:
             return
 
@@ -266,6 +273,17 @@ class VoiceManager:
         """Read-only view of active sessions (guild_id -> VoiceSession)."""
         return dict(self._sessions)
 
+    def snapshot_sessions(self) -> tuple[tuple[int, str], ...]:
+        """Snapshot of (guild_id, channel name) for every active session.
+
+        Built synchronously, so no join/leave can interleave with it, and
+        no live VoiceSession escapes to the caller.
+        """
+        return tuple(
+            (gid, s.channel.name if s.channel else "Unknown")
+            for gid, s in self._sessions.items()
+        )
+
     def reset_inactivity(self, guild_id: int, timeout: int | None = None) -> None:
         """Public API to reset the inactivity timer for a guild."""
         self._reset_inactivity_timer(guild_id, timeout=timeout)
@@ -274,6 +292,11 @@ class VoiceManager:
         """Disconnect from all voice channels."""
         for guild_id in list(self._sessions):
             await self.leave_channel(guild_id)
+        if self._shared_tts:
+            await self._shared_tts.close()
+        await self._piper_pool.close()
+        if self._shared_stt:
+            self._shared_stt.close()
         if self._http and not self._http.closed:
             await self._http.close()
 
@@ -395,8 +418,7 @@ class VoiceManager:
             return {"status": "error", "error": "WAV to OGG conversion failed"}
 
         # Calculate waveform and duration
-        duration = get_wav_duration(wav_bytes)
-        waveform = calculate_waveform(wav_bytes)
+        duration, waveform = analyze_wav(wav_bytes)
 
         # Send voice message
         success = await send_voice_message(
@@ -530,12 +552,12 @@ class VoiceManager:
     async def _get_shared_tts(self) -> TextToSpeech:
         """Get or create a shared TTS instance for voicemail."""
         if self._shared_tts is None:
-            self._shared_tts = TextToSpeech(self.config.tts)
+            self._shared_tts = TextToSpeech(self.config.tts, piper_pool=self._piper_pool)
             await self._shared_tts.warm_up()
         return self._shared_tts
 
     async def _get_http(self) -> aiohttp.ClientSession:
         """Get or create a shared HTTP session for Discord API calls."""
         if self._http is None or self._http.closed:
-            self._http = aiohttp.ClientSession()
+            self._http = create_http_session()
         return self._http
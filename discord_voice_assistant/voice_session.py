@@ -16,7 +16,11 @@ import discord
 
 from discord_voice_assistant.audio.sink import StreamingSink, PLAYBACK_SPEECH_THRESHOLD
 from discord_voice_assistant.audio.stt import SpeechToText
-from discord_voice_assistant.audio.tts import TextToSpeech, generate_thinking_sound
+from discord_voice_assistant.audio.tts import (
+    PiperWorkerPool,
+    TextToSpeech,
+    generate_thinking_sound,
+)
 from discord_voice_assistant.audio.wake_word import WakeWordDetector
 from discord_voice_assistant.integrations.openclaw import OpenClawClient
 
@@ -200,6 +204,7 @@ class VoiceSession:
         channel: discord.VoiceChannel,
         bridge: VoiceBridgeClient,
         shared_stt: SpeechToText | None = None,
+        piper_pool: PiperWorkerPool | None = None,
     ) -> None:
         self.bot = bot
         self.config = config
@@ -212,6 +217,8 @@ class VoiceSession:
         # Use shared (preloaded) STT instance if provided, otherwise create per-session
         self._stt: SpeechToText | None = shared_stt
         self._owns_stt = shared_stt is None
+        # Piper workers shared across sessions (owned by VoiceManager)
+        self._piper_pool = piper_pool
         self._tts: TextToSpeech | None = None
         self._wake_word: WakeWordDetector | None = None
         self._openclaw: OpenClawClient | None = None
@@ -270,7 +277,7 @@ class VoiceSession:
         if self._stt is None:
             self._stt = SpeechToText(self.config.stt)
             self._owns_stt = True
-        self._tts = TextToSpeech(self.config.tts)
+        self._tts = TextToSpeech(self.config.tts, piper_pool=self._piper_pool)
         if self.config.wake_word.enabled:
             self._wake_word = WakeWordDetector(self.config.wake_word)
             log.info("Wake word detection ENABLED")
@@ -525,6 +532,12 @@ class VoiceSession:
                 await self._openclaw.end_session(self._session_id)
             await self._openclaw.close()
 
+        if self._tts:
+            await self._tts.close()
+
+        if self._stt and self._owns_stt:
+            self._stt.close()
+
         if self._sink:
             self._sink.cleanup()
 
@@ -0,0 +1,201 @@
+"""Tests for AuthStore persistence."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from discord_voice_assistant.auth_store import _FLUSH_DELAY, ROLE_ADMIN, AuthStore
+
+ADMIN = 111111111111111111
+USER = 222222222222222222
+GUILD = 333333333333333333
+CHANNEL = 444444444444444444
+
+
+def _read(path):
+    return json.loads(path.read_text())
+
+
+@pytest.fixture
+def store(tmp_path):
+    return AuthStore(
+        data_dir=tmp_path,
+        bootstrap_user_ids=[USER],
+        bootstrap_admin_ids=[ADMIN],
+        default_agent_id="voice",
+    )
+
+
+@pytest.fixture
+def fsyncs(monkeypatch):
+    """Record every file write (each one ends in an fsync)."""
+    calls = []
+    real_fsync = os.fsync
+
+    def counting_fsync(fd):
+        calls.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", counting_fsync)
+    return calls
+
+
+def test_bootstrap_is_written_immediately(store, tmp_path):
+    users = _read(tmp_path / "authorized_users.json")["users"]
+    assert users[str(ADMIN)]["role"] == "admin"
+    assert users[str(USER)]["role"] == "user"
+
+
+def test_round_trip(store, tmp_path):
+    store.add_user(555, role=ROLE_ADMIN, added_by=ADMIN)
+    store.set_agent_id(USER, "research")
+    store.set_user_voice(USER, local_tts_model="en_US-amy-medium")
+    store.set_user_voice(ADMIN, elevenlabs_voice_id="21m00Tcm4TlvDq8ikWAM")
+    store.set_global_tts_provider("elevenlabs")
+    store.add_allowed_channel(GUILD, CHANNEL)
+
+    reloaded = AuthStore(data_dir=tmp_path, default_agent_id="voice")
+    assert reloaded.get_all_users() == store.get_all_users()
+    assert reloaded.get_all_routes() == store.get_all_routes()
+    assert reloaded.get_all_voice_configs() == store.get_all_voice_configs()
+    assert reloaded.is_admin(555)
+    assert reloaded.admin_count == 2
+    assert reloaded.get_agent_id(USER) == "research"
+    assert reloaded.get_agent_id(ADMIN) == "voice"
+    assert reloaded.get_user_voice(USER) == {"local_tts_model": "en_US-amy-medium"}
+    assert reloaded.get_effective_tts_provider("local") == "elevenlabs"
+    assert reloaded.get_allowed_channels(GUILD) == [CHANNEL]
+
+
+async def test_mutations_are_coalesced_into_one_write(store, tmp_path, fsyncs):
+    for uid in range(1, 11):
+        store.add_user(uid, added_by=ADMIN)
+    assert fsyncs == []
+    assert "1" not in _read(tmp_path / "authorized_users.json")["users"]
+
+    await asyncio.sleep(_FLUSH_DELAY * 5)
+    assert len(fsyncs) == 1
+    users = _read(tmp_path / "authorized_users.json")["users"]
+    assert {str(uid) for uid in range(1, 11)} <= set(users)
+
+
+async def test_flush_persists_pending_changes_immediately(store, tmp_path):
+    store.set_agent_id(USER, "ops")
+    store.flush()
+    assert _read(tmp_path / "agent_routing.json")["routes"][str(USER)] == {
+        "agent_id": "ops",
+    }
+
+
+async def test_reload_discards_unflushed_changes(store, tmp_path):
+    store.add_user(999, added_by=ADMIN)
+    store.reload()
+    assert not store.is_authorized(999)
+    assert store.is_authorized(USER)
+
+    await asyncio.sleep(_FLUSH_DELAY * 5)
+    assert "999" not in _read(tmp_path / "authorized_users.json")["users"]
+
+
+def test_sorted_user_ids_track_membership(store):
+    assert store.get_sorted_user_ids() == [ADMIN, USER]
+    store.add_user(555, added_by=ADMIN)
+    assert store.get_sorted_user_ids() == [555, ADMIN, USER]
+    store.remove_user(ADMIN)
+    assert store.get_sorted_user_ids() == [555, USER]
+    assert [r.uid for r in store.snapshot_admin_view()] == [555, USER]
+
+
+def test_sorted_user_ids_rebuilt_on_reload(store, tmp_path):
+    users = _read(tmp_path / "authorized_users.json")
+    users["users"]["42"] = {"role": "user", "added_by": "manual"}
+    (tmp_path / "authorized_users.json").write_text(json.dumps(users))
+
+    store.reload()
+    assert store.get_sorted_user_ids() == [42, ADMIN, USER]
+
+
+def test_lookups_take_int_ids(store):
+    assert store.is_authorized(USER)
+    assert store.is_admin(ADMIN)
+    assert not store.is_admin(USER)
+    assert not store.is_authorized(str(USER))
+    assert set(store.get_all_users()) == {ADMIN, USER}
+
+
+def test_disk_format_uses_str_keys(store, tmp_path):
+    store.set_agent_id(USER, "research")
+    store.set_user_voice(ADMIN, elevenlabs_voice_id="21m00Tcm4TlvDq8ikWAM")
+
+    assert set(_read(tmp_path / "authorized_users.json")["users"]) == {
+        str(ADMIN), str(USER),
+    }
+    assert _read(tmp_path / "agent_routing.json")["routes"] == {
+        str(USER): {"agent_id": "research"},
+    }
+    assert set(_read(tmp_path / "voice_config.json")["users"]) == {str(ADMIN)}
+
+
+def test_loads_str_keyed_json_as_int_ids(tmp_path):
+    (tmp_path / "authorized_users.json").write_text(json.dumps({
+        "users": {str(USER): {"role": "admin", "added_by": "manual"}},
+    }))
+    (tmp_path / "agent_routing.json").write_text(json.dumps({
+        "routes": {str(USER): {"agent_id": "ops"}},
+    }))
+    (tmp_path / "voice_config.json").write_text(json.dumps({
+        "global": {}, "users": {str(USER): {"local_tts_model": "en_GB-alan-medium"}},
+    }))
+
+    store = AuthStore(data_dir=tmp_path, default_agent_id="voice")
+    assert store.is_admin(USER)
+    assert store.get_agent_id(USER) == "ops"
+    assert store.get_effective_local_model(USER, "default") == "en_GB-alan-medium"
+
+
+def test_non_numeric_keys_are_skipped(tmp_path, caplog):
+    (tmp_path / "authorized_users.json").write_text(json.dumps({
+        "users": {
+            str(USER): {"role": "admin", "added_by": "manual"},
+            "alice": {"role": "user", "added_by": "manual"},
+        },
+    }))
+    (tmp_path / "agent_routing.json").write_text(json.dumps({
+        "routes": {"bob": {"agent_id": "ops"}},
+    }))
+    (tmp_path / "voice_config.json").write_text(json.dumps({
+        "global": {}, "users": {"": {"local_tts_model": "en_GB-alan-medium"}},
+    }))
+
+    store = AuthStore(data_dir=tmp_path, default_agent_id="voice")
+    assert store.get_sorted_user_ids() == [USER]
+    assert store.get_all_routes() == {}
+    assert store.get_all_voice_configs() == {}
+    assert "'alice'" in caplog.text
+    assert "'bob'" in caplog.text
+
+    store.reload()
+    assert store.get_sorted_user_ids() == [USER]
+
+
+async def test_late_background_write_does_not_clobber_flush(store, tmp_path, monkeypatch):
+    # Hold the background flush's thread write until after the shutdown flush()
+    held = []
+
+    async def hold_to_thread(func, /, *args):
+        held.append((func, args))
+
+    monkeypatch.setattr(asyncio, "to_thread", hold_to_thread)
+    store.add_user(555, added_by=ADMIN)
+    await asyncio.sleep(_FLUSH_DELAY * 5)
+    assert len(held) == 1
+
+    store.add_user(666, added_by=ADMIN)
+    store.flush()
+    func, args = held.pop()
+    func(*args)
+
+    users = _read(tmp_path / "authorized_users.json")["users"]
+    assert {"555", "666"} <= set(users)
@@ -0,0 +1,86 @@
+"""Tests for voice catalog lookups used by the voice commands."""
+
+import pytest
+
+pytest.importorskip("discord")
+
+from discord_voice_assistant.commands.voice_config import (  # noqa: E402
+    ELEVENLABS_VOICES,
+    PIPER_VOICES,
+    _match_voices,
+    _voice_display_name,
+)
+
+
+def _reference_match(voices, current, limit):
+    """Plain scan: name-prefix hits (sorted by name), then substring hits."""
+    query = current.lower()
+    if not query:
+        return [value for _, value in voices[:limit]]
+    prefix = sorted(
+        (name.lower(), value) for name, value in voices
+        if name.lower().startswith(query)
+    )
+    hits = [value for _, value in prefix][:limit]
+    for name, value in voices:
+        if len(hits) >= limit:
+            break
+        if value not in hits and (query in name.lower() or query in value.lower()):
+            hits.append(value)
+    return hits
+
+
+def _values(choices):
+    return [c.value for c in choices]
+
+
+def test_empty_query_returns_catalog_order():
+    assert _values(_match_voices("local", "", 24)) == [v for _, v in PIPER_VOICES[:24]]
+    assert _values(_match_voices("local", "", 5)) == [v for _, v in PIPER_VOICES[:5]]
+
+
+def test_name_prefix_matches_come_first():
+    values = _values(_match_voices("local", "ry", 25))
+    assert values[:2] == ["en_US-ryan-high", "en_US-ryan-medium"]
+
+
+def test_prefix_match_is_case_insensitive():
+    assert _values(_match_voices("local", "LESSAC", 25))[:2] == _values(
+        _match_voices("local", "lessac", 25)
+    )[:2]
+
+
+def test_substring_matches_value():
+    assert "en_GB-vctk-medium" in _values(_match_voices("local", "vctk", 25))
+    assert _values(_match_voices("elevenlabs", "21m00", 25)) == ["21m00Tcm4TlvDq8ikWAM"]
+
+
+def test_no_duplicates_and_limit_respected():
+    values = _values(_match_voices("local", "medium", 7))
+    assert len(values) == 7
+    assert len(set(values)) == 7
+
+
+def test_no_match():
+    assert _match_voices("local", "zzzz", 25) == []
+
+
+def test_unknown_provider_uses_piper_catalog():
+    assert _values(_match_voices("bogus", "", 3)) == [v for _, v in PIPER_VOICES[:3]]
+
+
+@pytest.mark.parametrize("provider, voices", [
+    ("local", PIPER_VOICES),
+    ("elevenlabs", ELEVENLABS_VOICES),
+])
+@pytest.mark.parametrize("query", ["", "a", "en", "us", "gb", "me", "ry", "-", "young", "x"])
+def test_matches_reference_scan(provider, voices, query):
+    assert _values(_match_voices(provider, query, 24)) == _reference_match(
+        voices, query, 24
+    )
+
+
+def test_display_name_lookup():
+    assert _voice_display_name("local", "en_US-amy-medium") == "Amy (US, medium)"
+    assert _voice_display_name("elevenlabs", "21m00Tcm4TlvDq8ikWAM").startswith("Rachel")
+    assert _voice_display_name("local", "custom-model") == "custom-model"
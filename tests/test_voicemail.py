@@ -0,0 +1,77 @@
+"""Tests for voice-message waveform generation."""
+
+import base64
+
+import numpy as np
+import pytest
+
+from discord_voice_assistant.audio.voicemail import (
+    _WAVEFORM_MSQ_THRESHOLDS,
+    _waveform_from_frames,
+)
+
+
+def _reference_waveform(raw: bytes, n_channels: int, num_bars: int) -> bytes:
+    """The original sqrt/scale/clamp formula the threshold table replaced."""
+    samples = np.frombuffer(raw, dtype=np.int16)
+    if n_channels == 2 and len(samples) % 2 == 0:
+        samples = samples.reshape(-1, 2).mean(axis=1).astype(np.int16)
+    if len(samples) == 0:
+        return bytes(num_bars)
+    chunk_size = max(1, len(samples) // num_bars)
+    n_rows = min(num_bars, len(samples) // chunk_size)
+    chunks = samples[: n_rows * chunk_size].reshape(n_rows, chunk_size)
+    chunks = chunks.astype(np.float32)
+    rms = np.sqrt(np.mean(chunks * chunks, axis=1))
+    bars = np.zeros(num_bars, dtype=np.uint8)
+    bars[:n_rows] = np.minimum(rms * (255 * 4 / 32768), 255).astype(np.uint8)
+    return bars.tobytes()
+
+
+def _bars(raw: bytes, n_channels: int = 1, num_bars: int = 256) -> bytes:
+    return base64.b64decode(_waveform_from_frames(raw, n_channels, num_bars))
+
+
+def test_thresholds_match_formula_on_mean_square_grid():
+    msq = np.arange(0, 2**30, 997, dtype=np.float64).astype(np.float32)
+    got = np.searchsorted(_WAVEFORM_MSQ_THRESHOLDS, msq, side="right")
+    expected = np.minimum(np.sqrt(msq) * (255 * 4 / 32768), 255).astype(np.uint8)
+    np.testing.assert_array_equal(got, expected)
+
+
+@pytest.mark.parametrize("n_channels", [1, 2])
+def test_matches_reference_on_random_audio(n_channels):
+    rng = np.random.default_rng(1234)
+    for _ in range(300):
+        amplitude = rng.integers(1, 32768)
+        n = int(rng.integers(0, 20000))
+        raw = (
+            (rng.standard_normal(n) * amplitude / 3)
+            .clip(-32768, 32767)
+            .astype(np.int16)
+            .tobytes()
+        )
+        assert _bars(raw, n_channels) == _reference_waveform(raw, n_channels, 256)
+
+
+def test_constant_levels_match_reference():
+    for value in range(0, 32768, 7):
+        raw = np.full(512, value, dtype=np.int16).tobytes()
+        assert _bars(raw) == _reference_waveform(raw, 1, 256)
+
+
+def test_empty_audio_is_all_zero():
+    assert _bars(b"", num_bars=64) == bytes(64)
+
+
+def test_short_clip_pads_with_zero():
+    raw = np.full(10, 16000, dtype=np.int16).tobytes()
+    bars = _bars(raw, num_bars=32)
+    assert len(bars) == 32
+    assert all(b > 0 for b in bars[:10])
+    assert bars[10:] == bytes(22)
+
+
+def test_loud_audio_saturates_at_255():
+    raw = np.full(1024, 32767, dtype=np.int16).tobytes()
+    assert set(_bars(raw)) == {255}